@@ -1,313 +1,405 @@
 #!/usr/bin/env python3
 
+import hashlib
 import os
-import json
-import random
-from flask import Flask, request, jsonify
+import time
+import zlib
+import numpy as np
+import orjson
+from flask import Flask, Response, request
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 # Initialize Flask app
 app = Flask(__name__)
+# Serve '/health/' and '/health' alike instead of redirecting with a 308
+app.url_map.strict_slashes = False
 CORS(app)
 
+# Available market feeds for analysis
+_AVAILABLE_FEEDS = {
+    'BTC/USD': 'Bitcoin',
+    'ETH/USD': 'Ethereum',
+    'XRP/USD': 'XRP',
+    'FLR/USD': 'Flare',
+    'DOGE/USD': 'Dogecoin',
+    'SOL/USD': 'Solana',
+    'AVAX/USD': 'Avalanche',
+    'BNB/USD': 'Binance Coin',
+    'USDC/USD': 'USD Coin',
+    'USDT/USD': 'Tether',
+    'EUR/USD': 'Euro',
+    'JPY/USD': 'Japanese Yen',
+    'GBP/USD': 'British Pound',
+    'GOLD/USD': 'Gold',
+    'SILVER/USD': 'Silver',
+    'OIL/USD': 'Crude Oil'
+}
+
+# Base price and volatility used to synthesize sample feed data
+_BASE_PRICES = {
+    'BTC/USD': 65000.0,
+    'ETH/USD': 3500.0,
+    'XRP/USD': 0.59,
+    'FLR/USD': 0.024,
+    'DOGE/USD': 0.15,
+    'SOL/USD': 125.0,
+    'AVAX/USD': 35.0,
+    'BNB/USD': 580.0,
+    'USDC/USD': 1.0,
+    'USDT/USD': 1.0,
+    'EUR/USD': 1.09,
+    'JPY/USD': 0.0067,
+    'GBP/USD': 1.28,
+    'GOLD/USD': 2200.0,
+    'SILVER/USD': 25.0,
+    'OIL/USD': 75.0
+}
+
+_VOLATILITY = {
+    'BTC/USD': 0.05,
+    'ETH/USD': 0.07,
+    'XRP/USD': 0.08,
+    'FLR/USD': 0.1,
+    'DOGE/USD': 0.12,
+    'SOL/USD': 0.09,
+    'AVAX/USD': 0.08,
+    'BNB/USD': 0.06,
+    'USDC/USD': 0.001,
+    'USDT/USD': 0.001,
+    'EUR/USD': 0.01,
+    'JPY/USD': 0.01,
+    'GBP/USD': 0.015,
+    'GOLD/USD': 0.02,
+    'SILVER/USD': 0.03,
+    'OIL/USD': 0.04
+}
+
+# Number of points, spacing in seconds, price spread multiplier and volume range
+# for each generated timeframe
+_HOUR = 3600
+_DAY = 24 * _HOUR
+_WEEK = 7 * _DAY
+
+_TIMEFRAME_SPECS = {
+    "1h": (24, _HOUR, 1, (100, 1000)),
+    "1d": (30, _DAY, 2, (1000, 10000)),
+    "1w": (12, _WEEK, 3, (5000, 50000)),
+    "1m": (12, 30 * _DAY, 4, (20000, 200000))
+}
+
+# Multipliers of the current price for the support, resistance, Bollinger
+# band and Fibonacci retracement levels reported by /market_analysis
+_LEVEL_MULTIPLIERS = np.array([
+    0.92, 0.85,                    # support
+    1.08, 1.15,                    # resistance
+    1.05, 0.95,                    # bollinger upper / lower
+    0.98, 0.96, 0.94, 0.92, 0.9    # fibonacci retracement
+])
+_FIB_RATIOS = ("0.236", "0.382", "0.5", "0.618", "0.786")
+
+# Categorical fields of the market analysis
+_TRENDS = ("bullish", "bearish", "neutral")
+_DIRECTIONS = ("up", "down", "sideways")
+_SENTIMENTS = ("fear", "greed", "neutral", "extreme fear", "extreme greed")
+_HORIZONS = (("short_term", "24h"), ("medium_term", "7d"), ("long_term", "30d"))
+_AI_MODELS = ("qwen", "llama", "gemini", "claude")
+
+# Number of options for the trend, the three horizon directions and the sentiment
+_CHOICE_COUNTS = np.array([len(_TRENDS)] + [len(_DIRECTIONS)] * len(_HORIZONS) + [len(_SENTIMENTS)])
+
+# Bounds of the uniformly drawn scores: overall confidence, horizon
+# confidences, model confidences, RSI and MACD value / signal / histogram
+_SCORE_LOW = np.array([0.6, 0.7, 0.6, 0.5, 0.7, 0.7, 0.7, 0.7, 1, -10, -10, -5])
+_SCORE_HIGH = np.array([0.95, 0.9, 0.85, 0.8, 0.9, 0.9, 0.9, 0.9, 100, 10, 10, 5])
+
+# Maximum relative deviation from the current price for the horizon
+# targets, the model predictions and the 50/200 period moving averages
+_TARGET_SPREADS = np.array([0.1, 0.2, 0.3, 0.05, 0.06, 0.07, 0.08, 0.1, 0.15])
+
+# Information about the AI models used in predictions
+_MODELS = {
+    "qwen": {
+        "name": "Qwen",
+        "version": "1.5",
+        "accuracy": 0.89,
+        "specialization": "Long-term market trends and tokenomics"
+    },
+    "llama": {
+        "name": "Llama",
+        "version": "3",
+        "accuracy": 0.87,
+        "specialization": "Technical analysis and on-chain metrics"
+    },
+    "gemini": {
+        "name": "Gemini",
+        "version": "1.5",
+        "accuracy": 0.91,
+        "specialization": "Multimodal analysis and market psychology"
+    },
+    "claude": {
+        "name": "Claude",
+        "version": "3",
+        "accuracy": 0.86,
+        "specialization": "Social sentiment and creator reputation"
+    }
+}
+
+_MODEL_UPDATE_AGE = {
+    "qwen": timedelta(days=3),
+    "llama": timedelta(days=5),
+    "gemini": timedelta(days=2),
+    "claude": timedelta(days=4)
+}
+
+# Static part of the /health response
+_HEALTH_TEMPLATE = {
+    "status": "healthy",
+    "service": "Forecaster Market Data API",
+    "version": "1.0.0"
+}
+
+def _etag(body):
+    """Short content hash used as an ETag"""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+# The feed list for the default network never changes, so serialize it once
+_FEEDS_RESPONSE_BYTES = orjson.dumps({
+    "available_feeds": _AVAILABLE_FEEDS,
+    "network": "default",
+    "status": "success"
+})
+_FEEDS_ETAG = _etag(_FEEDS_RESPONSE_BYTES)
+
+# Error body for requests without a feed_id. Only the bytes are shared; a
+# fresh Response is built per request since middleware mutates its headers
+_MISSING_FEED_ID_BYTES = orjson.dumps({
+    "error": "Missing required parameter: feed_id",
+    "status": "failed"
+})
+_NOT_FOUND_BYTES = orjson.dumps({
+    "error": "Not found",
+    "status": "failed"
+})
+
+def cached_json_response(body, etag, max_age):
+    """Serve pre-serialized JSON with cache validators, or 304 if the client's copy is current"""
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response
+
+def json_response(obj, status=200):
+    """Serialize obj with orjson and wrap it in a JSON Response"""
+    return Response(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
+@app.errorhandler(404)
+def handle_not_found(e):
+    """Answer unknown paths with a precomputed JSON 404"""
+    return Response(_NOT_FOUND_BYTES, status=404, mimetype='application/json')
+
+@app.errorhandler(Exception)
+def handle_exception(e):
+    """Serialize errors raised by any endpoint as a JSON 500 response"""
+    # Let Flask render the remaining HTTP errors such as 405
+    if isinstance(e, HTTPException):
+        return e
+    return json_response({
+        "error": str(e),
+        "status": "failed"
+    }, status=500)
+
 @app.route('/query_data_feeds', methods=['GET'])
 def query_data_feeds_api():
     """API endpoint to query available data feeds"""
-    try:
-        # Get network parameter from request
-        network = request.args.get('network', 'default')
-        
-        # Available market feeds for analysis
-        available_feeds = {
-            'BTC/USD': 'Bitcoin',
-            'ETH/USD': 'Ethereum',
-            'XRP/USD': 'XRP',
-            'FLR/USD': 'Flare',
-            'DOGE/USD': 'Dogecoin',
-            'SOL/USD': 'Solana',
-            'AVAX/USD': 'Avalanche',
-            'BNB/USD': 'Binance Coin',
-            'USDC/USD': 'USD Coin',
-            'USDT/USD': 'Tether',
-            'EUR/USD': 'Euro',
-            'JPY/USD': 'Japanese Yen',
-            'GBP/USD': 'British Pound',
-            'GOLD/USD': 'Gold',
-            'SILVER/USD': 'Silver',
-            'OIL/USD': 'Crude Oil'
-        }
-        
-        return jsonify({
-            "available_feeds": available_feeds,
-            "network": network,
-            "status": "success"
-        })
+    # Get network parameter from request
+    network = request.args.get('network', 'default')
+    
+    if network == 'default':
+        return cached_json_response(_FEEDS_RESPONSE_BYTES, _FEEDS_ETAG, max_age=3600)
     
-    except Exception as e:
-        return jsonify({
-            "error": str(e),
-            "status": "failed"
-        }), 500
+    return json_response({
+        "available_feeds": _AVAILABLE_FEEDS,
+        "network": network,
+        "status": "success"
+    })
 
 @app.route('/fetch_feed_data', methods=['GET'])
 def fetch_feed_data_api():
     """API endpoint to fetch detailed data for a specific feed"""
-    try:
-        # Get parameters from the request
-        feed_id = request.args.get('feed_id')
-        network = request.args.get('network', 'default')
-        
-        if not feed_id:
-            return jsonify({
-                "error": "Missing required parameter: feed_id",
-                "status": "failed"
-            }), 400
-        
-        # Generate sample data for the requested feed
-        feed_data = generate_sample_feed_data(feed_id)
-        
-        return jsonify({
-            "feed_data": feed_data,
-            "network": network,
-            "status": "success"
-        })
+    # Get parameters from the request
+    feed_id = request.args.get('feed_id')
+    network = request.args.get('network', 'default')
+    
+    if not feed_id:
+        return Response(_MISSING_FEED_ID_BYTES, status=400, mimetype='application/json')
     
-    except Exception as e:
-        return jsonify({
-            "error": str(e),
-            "status": "failed"
-        }), 500
+    # Serve the sample data generated for the requested feed this minute
+    body = _cached_feed_response(feed_id, network, int(time.time() // 60))
+    return Response(body, mimetype='application/json')
 
 @app.route('/market_analysis', methods=['GET'])
 def market_analysis_api():
     """API endpoint to provide comprehensive market analysis"""
-    try:
-        # Get parameters from the request
-        feed_id = request.args.get('feed_id')
-        timeframe = request.args.get('timeframe', '1d')
-        
-        if not feed_id:
-            return jsonify({
-                "error": "Missing required parameter: feed_id",
-                "status": "failed"
-            }), 400
-        
-        # Generate market analysis data
-        feed_data = generate_sample_feed_data(feed_id)
-        
-        # Add AI-generated analysis
-        market_analysis = {
-            "trend": random.choice(["bullish", "bearish", "neutral"]),
-            "confidence": round(random.uniform(0.6, 0.95), 2),
-            "key_levels": {
-                "support": [round(feed_data["current_price"] * 0.92, 2), round(feed_data["current_price"] * 0.85, 2)],
-                "resistance": [round(feed_data["current_price"] * 1.08, 2), round(feed_data["current_price"] * 1.15, 2)]
-            },
-            "prediction": {
-                "short_term": {
-                    "direction": random.choice(["up", "down", "sideways"]),
-                    "target": round(feed_data["current_price"] * random.uniform(0.9, 1.1), 2),
-                    "timeframe": "24h",
-                    "confidence": round(random.uniform(0.7, 0.9), 2)
-                },
-                "medium_term": {
-                    "direction": random.choice(["up", "down", "sideways"]),
-                    "target": round(feed_data["current_price"] * random.uniform(0.8, 1.2), 2),
-                    "timeframe": "7d",
-                    "confidence": round(random.uniform(0.6, 0.85), 2)
-                },
-                "long_term": {
-                    "direction": random.choice(["up", "down", "sideways"]),
-                    "target": round(feed_data["current_price"] * random.uniform(0.7, 1.3), 2),
-                    "timeframe": "30d",
-                    "confidence": round(random.uniform(0.5, 0.8), 2)
-                }
-            },
-            "risk_assessment": round(random.uniform(1, 10), 1),
-            "volatility_index": round(random.uniform(1, 10), 1),
-            "market_sentiment": random.choice(["fear", "greed", "neutral", "extreme fear", "extreme greed"]),
-            "ai_models_consensus": {
-                "qwen": {
-                    "prediction": round(feed_data["current_price"] * random.uniform(0.95, 1.05), 2),
-                    "confidence": round(random.uniform(0.7, 0.9), 2)
-                },
-                "llama": {
-                    "prediction": round(feed_data["current_price"] * random.uniform(0.94, 1.06), 2),
-                    "confidence": round(random.uniform(0.7, 0.9), 2)
-                },
-                "gemini": {
-                    "prediction": round(feed_data["current_price"] * random.uniform(0.93, 1.07), 2),
-                    "confidence": round(random.uniform(0.7, 0.9), 2)
-                },
-                "claude": {
-                    "prediction": round(feed_data["current_price"] * random.uniform(0.92, 1.08), 2),
-                    "confidence": round(random.uniform(0.7, 0.9), 2)
-                }
-            }
-        }
-        
-        # Add technical indicators
-        technical_indicators = {
-            "rsi": round(random.uniform(1, 100), 2),
-            "macd": {
-                "value": round(random.uniform(-10, 10), 2),
-                "signal": round(random.uniform(-10, 10), 2),
-                "histogram": round(random.uniform(-5, 5), 2)
-            },
-            "ma_50": round(feed_data["current_price"] * random.uniform(0.9, 1.1), 2),
-            "ma_200": round(feed_data["current_price"] * random.uniform(0.85, 1.15), 2),
-            "bollinger_bands": {
-                "upper": round(feed_data["current_price"] * 1.05, 2),
-                "middle": feed_data["current_price"],
-                "lower": round(feed_data["current_price"] * 0.95, 2)
-            },
-            "fibonacci_retracement": {
-                "0.236": round(feed_data["current_price"] * 0.98, 2),
-                "0.382": round(feed_data["current_price"] * 0.96, 2),
-                "0.5": round(feed_data["current_price"] * 0.94, 2),
-                "0.618": round(feed_data["current_price"] * 0.92, 2),
-                "0.786": round(feed_data["current_price"] * 0.9, 2)
+    # Get parameters from the request
+    feed_id = request.args.get('feed_id')
+    timeframe = request.args.get('timeframe', '1d')
+    
+    if not feed_id:
+        return Response(_MISSING_FEED_ID_BYTES, status=400, mimetype='application/json')
+    
+    # Generate market analysis data
+    feed_data = _cached_feed_data(feed_id, int(time.time() // 60))
+    
+    price = feed_data["current_price"]
+    
+    # Compute all fixed price levels in a single vectorized pass
+    support_1, support_2, resistance_1, resistance_2, bb_upper, bb_lower, *fib_levels = (
+        price * _LEVEL_MULTIPLIERS
+    ).round(2).tolist()
+    
+    # Draw every randomized field with a handful of vectorized calls on a
+    # per-request generator, so concurrent requests never share RNG state
+    rng = np.random.default_rng()
+    trend, *directions, sentiment = rng.integers(0, _CHOICE_COUNTS).tolist()
+    confidence, *scores = rng.uniform(_SCORE_LOW, _SCORE_HIGH).round(2).tolist()
+    horizon_confidences, model_confidences = scores[:3], scores[3:7]
+    rsi, macd_value, macd_signal, macd_histogram = scores[7:]
+    targets = (price * (1 + rng.uniform(-1, 1, len(_TARGET_SPREADS)) * _TARGET_SPREADS)).round(2).tolist()
+    horizon_targets, model_predictions, (ma_50, ma_200) = targets[:3], targets[3:7], targets[7:]
+    risk_assessment, volatility_index = rng.uniform(1, 10, 2).round(1).tolist()
+    
+    # Add AI-generated analysis
+    market_analysis = {
+        "trend": _TRENDS[trend],
+        "confidence": confidence,
+        "key_levels": {
+            "support": [support_1, support_2],
+            "resistance": [resistance_1, resistance_2]
+        },
+        "prediction": {
+            horizon: {
+                "direction": _DIRECTIONS[direction],
+                "target": target,
+                "timeframe": horizon_timeframe,
+                "confidence": horizon_confidence
             }
+            for (horizon, horizon_timeframe), direction, target, horizon_confidence
+            in zip(_HORIZONS, directions, horizon_targets, horizon_confidences)
+        },
+        "risk_assessment": risk_assessment,
+        "volatility_index": volatility_index,
+        "market_sentiment": _SENTIMENTS[sentiment],
+        "ai_models_consensus": {
+            model_id: {"prediction": prediction, "confidence": model_confidence}
+            for model_id, prediction, model_confidence
+            in zip(_AI_MODELS, model_predictions, model_confidences)
         }
-        
-        response = {
-            "feed_data": feed_data,
-            "market_analysis": market_analysis,
-            "technical_indicators": technical_indicators,
-            "timeframe": timeframe,
-            "status": "success"
-        }
-        
-        return jsonify(response)
+    }
     
-    except Exception as e:
-        return jsonify({
-            "error": str(e),
-            "status": "failed"
-        }), 500
+    # Add technical indicators
+    technical_indicators = {
+        "rsi": rsi,
+        "macd": {
+            "value": macd_value,
+            "signal": macd_signal,
+            "histogram": macd_histogram
+        },
+        "ma_50": ma_50,
+        "ma_200": ma_200,
+        "bollinger_bands": {
+            "upper": bb_upper,
+            "middle": price,
+            "lower": bb_lower
+        },
+        "fibonacci_retracement": dict(zip(_FIB_RATIOS, fib_levels))
+    }
+    
+    response = {
+        "feed_data": feed_data,
+        "market_analysis": market_analysis,
+        "technical_indicators": technical_indicators,
+        "timeframe": timeframe,
+        "status": "success"
+    }
+    
+    return json_response(response)
+
+def _feed_seed(feed_id):
+    """Stable per-feed seed (str hashes are randomized per process)"""
+    return zlib.crc32(feed_id.encode())
+
+def _round_prices(prices):
+    """Round prices to 4 decimals below $10 and to 2 decimals otherwise"""
+    return np.where(prices < 10, prices.round(4), prices.round(2))
+
+@lru_cache(maxsize=4)
+def _timestamps(second_bucket):
+    """ISO timestamps for the historical series and each timeframe.
+    
+    Every feed generated within the same second shares these strings.
+    """
+    # Subtract all offsets from the local wall-clock time in one vectorized
+    # datetime64 operation, then format the whole array at once
+    now = np.datetime64(datetime.fromtimestamp(second_bucket), 's')
+    stamps = {
+        name: (now - np.arange(points) * np.timedelta64(step, 's')).astype(str).tolist()
+        for name, (points, step, _, _) in _TIMEFRAME_SPECS.items()
+    }
+    # The historical series uses the same 24 hourly points as the 1h timeframe
+    stamps["historical"] = stamps["1h"]
+    stamps["now"] = stamps["1h"][0]
+    return stamps
 
 def generate_sample_feed_data(feed_id):
     """Generate sample feed data with realistic values"""
     # Use feed_id as a seed for random generation to ensure consistent values
     # for the same feed_id between calls
-    random.seed(feed_id)
-    
-    # Set base price and volatility based on the feed_id
-    base_prices = {
-        'BTC/USD': 65000.0,
-        'ETH/USD': 3500.0,
-        'XRP/USD': 0.59,
-        'FLR/USD': 0.024,
-        'DOGE/USD': 0.15,
-        'SOL/USD': 125.0,
-        'AVAX/USD': 35.0,
-        'BNB/USD': 580.0,
-        'USDC/USD': 1.0,
-        'USDT/USD': 1.0,
-        'EUR/USD': 1.09,
-        'JPY/USD': 0.0067,
-        'GBP/USD': 1.28,
-        'GOLD/USD': 2200.0,
-        'SILVER/USD': 25.0,
-        'OIL/USD': 75.0
-    }
+    rng = np.random.default_rng(_feed_seed(feed_id))
     
-    volatility = {
-        'BTC/USD': 0.05,
-        'ETH/USD': 0.07,
-        'XRP/USD': 0.08,
-        'FLR/USD': 0.1,
-        'DOGE/USD': 0.12,
-        'SOL/USD': 0.09,
-        'AVAX/USD': 0.08,
-        'BNB/USD': 0.06,
-        'USDC/USD': 0.001,
-        'USDT/USD': 0.001,
-        'EUR/USD': 0.01,
-        'JPY/USD': 0.01,
-        'GBP/USD': 0.015,
-        'GOLD/USD': 0.02,
-        'SILVER/USD': 0.03,
-        'OIL/USD': 0.04
-    }
-    
-    # Default values for unknown feeds
-    if feed_id not in base_prices:
-        base_prices[feed_id] = 100.0
-        volatility[feed_id] = 0.05
+    # Look up base price and volatility, with defaults for unknown feeds
+    base = _BASE_PRICES.get(feed_id, 100.0)
+    vol = _VOLATILITY.get(feed_id, 0.05)
     
     # Calculate current price with some random variation
-    current_price = base_prices[feed_id] * (1 + random.uniform(-volatility[feed_id], volatility[feed_id]))
-    previous_price = base_prices[feed_id] * (1 + random.uniform(-volatility[feed_id], volatility[feed_id]))
+    current_price, previous_price = (base * (1 + rng.uniform(-vol, vol, 2))).tolist()
     
     # Calculate change percentage
     change_24h = ((current_price - previous_price) / previous_price) * 100
     
-    # Generate historical data points
-    now = datetime.now()
-    historical_data = []
-    for i in range(24):
-        timestamp = (now - timedelta(hours=i)).isoformat()
-        # Add some trend with noise
-        trend_factor = 1 + ((24-i) / 24) * (change_24h/100) 
-        noise = random.uniform(-volatility[feed_id], volatility[feed_id]) * 0.5
-        price = previous_price * trend_factor * (1 + noise)
-        historical_data.append({
-            "timestamp": timestamp,
-            "price": round(price, 4 if price < 10 else 2)
-        })
-    
-    # Generate more detailed timeframe data
-    timeframes = {
-        "1h": [],
-        "1d": [],
-        "1w": [],
-        "1m": []
-    }
+    # Generate historical data points, adding some trend with noise
+    stamps = _timestamps(int(time.time()))
+    offsets = np.arange(24)
+    trend_factor = 1 + ((24 - offsets) / 24) * (change_24h / 100)
+    noise = rng.uniform(-vol, vol, 24) * 0.5
+    prices = _round_prices(previous_price * trend_factor * (1 + noise))
+    historical_data = [
+        {"timestamp": timestamp, "price": price}
+        for timestamp, price in zip(stamps["historical"], prices.tolist())
+    ]
     
-    # Generate hourly data for the last 24 hours
-    for i in range(24):
-        timestamp = (now - timedelta(hours=i)).isoformat()
-        price = base_prices[feed_id] * (1 + random.uniform(-volatility[feed_id], volatility[feed_id]))
-        timeframes["1h"].append({
-            "timestamp": timestamp,
-            "price": round(price, 4 if price < 10 else 2),
-            "volume": round(base_prices[feed_id] * random.uniform(100, 1000) * volatility[feed_id], 2)
-        })
-    
-    # Generate daily data for the last 30 days
-    for i in range(30):
-        timestamp = (now - timedelta(days=i)).isoformat()
-        price = base_prices[feed_id] * (1 + random.uniform(-volatility[feed_id] * 2, volatility[feed_id] * 2))
-        timeframes["1d"].append({
-            "timestamp": timestamp,
-            "price": round(price, 4 if price < 10 else 2),
-            "volume": round(base_prices[feed_id] * random.uniform(1000, 10000) * volatility[feed_id], 2)
-        })
-    
-    # Generate weekly data for the last 12 weeks
-    for i in range(12):
-        timestamp = (now - timedelta(weeks=i)).isoformat()
-        price = base_prices[feed_id] * (1 + random.uniform(-volatility[feed_id] * 3, volatility[feed_id] * 3))
-        timeframes["1w"].append({
-            "timestamp": timestamp,
-            "price": round(price, 4 if price < 10 else 2),
-            "volume": round(base_prices[feed_id] * random.uniform(5000, 50000) * volatility[feed_id], 2)
-        })
-    
-    # Generate monthly data for the last 12 months
-    for i in range(12):
-        timestamp = (now - timedelta(days=i*30)).isoformat()
-        price = base_prices[feed_id] * (1 + random.uniform(-volatility[feed_id] * 4, volatility[feed_id] * 4))
-        timeframes["1m"].append({
-            "timestamp": timestamp,
-            "price": round(price, 4 if price < 10 else 2),
-            "volume": round(base_prices[feed_id] * random.uniform(20000, 200000) * volatility[feed_id], 2)
-        })
-    
-    # Reset random seed after generating data
-    random.seed()
+    # Generate more detailed timeframe data (hourly for the last 24 hours,
+    # daily for 30 days, weekly for 12 weeks and monthly for 12 months) as
+    # parallel timestamp/price/volume arrays rather than one dict per point
+    timeframes = {}
+    for name, (points, _, spread, volume_range) in _TIMEFRAME_SPECS.items():
+        prices = _round_prices(base * (1 + rng.uniform(-vol * spread, vol * spread, points)))
+        volumes = (base * rng.uniform(*volume_range, points) * vol).round(2)
+        timeframes[name] = {
+            "timestamp": stamps[name],
+            "price": prices.tolist(),
+            "volume": volumes.tolist()
+        }
     
     # Return the generated data
     return {
@@ -316,75 +408,63 @@ def generate_sample_feed_data(feed_id):
         "current_price": round(current_price, 4 if current_price < 10 else 2),
         "previous_price": round(previous_price, 4 if previous_price < 10 else 2),
         "change_24h": round(change_24h, 2),
-        "updated_at": now.isoformat(),
+        "updated_at": stamps["now"],
         "historical_data": historical_data,
         "timeframes": timeframes
     }
 
+@lru_cache(maxsize=512)
+def _cached_feed_data(feed_id, minute_bucket):
+    """Sample feed data, regenerated at most once per minute per feed.
+    
+    The returned dict is shared between requests and must not be mutated.
+    """
+    return generate_sample_feed_data(feed_id)
+
+@lru_cache(maxsize=512)
+def _cached_feed_response(feed_id, network, minute_bucket):
+    """Serialized /fetch_feed_data body for the given feed, network and minute"""
+    return orjson.dumps({
+        "feed_data": _cached_feed_data(feed_id, minute_bucket),
+        "network": network,
+        "status": "success"
+    })
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        "status": "healthy",
-        "service": "Forecaster Market Data API",
-        "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
-    })
+    return json_response({**_HEALTH_TEMPLATE, "timestamp": datetime.now()})
 
 @app.route('/model_stats', methods=['GET'])
 def model_stats_api():
     """API endpoint to provide statistics about AI models used in predictions"""
-    try:
-        # Return information about available AI models
-        models = {
-            "qwen": {
-                "name": "Qwen",
-                "version": "1.5",
-                "accuracy": 0.89,
-                "specialization": "Long-term market trends and tokenomics",
-                "last_updated": (datetime.now() - timedelta(days=3)).isoformat()
-            },
-            "llama": {
-                "name": "Llama",
-                "version": "3",
-                "accuracy": 0.87,
-                "specialization": "Technical analysis and on-chain metrics",
-                "last_updated": (datetime.now() - timedelta(days=5)).isoformat()
-            },
-            "gemini": {
-                "name": "Gemini",
-                "version": "1.5",
-                "accuracy": 0.91,
-                "specialization": "Multimodal analysis and market psychology",
-                "last_updated": (datetime.now() - timedelta(days=2)).isoformat()
-            },
-            "claude": {
-                "name": "Claude",
-                "version": "3",
-                "accuracy": 0.86,
-                "specialization": "Social sentiment and creator reputation",
-                "last_updated": (datetime.now() - timedelta(days=4)).isoformat()
-            }
-        }
-        
-        return jsonify({
-            "models": models,
-            "status": "success"
-        })
-    
-    except Exception as e:
-        return jsonify({
-            "error": str(e),
-            "status": "failed"
-        }), 500
+    # The payload is regenerated hourly, so clients may cache it until then
+    now = int(time.time())
+    body, etag = _model_stats_response(now // _HOUR)
+    return cached_json_response(body, etag, max_age=_HOUR - now % _HOUR)
+
+@lru_cache(maxsize=2)
+def _model_stats_response(hour_bucket):
+    """Serialized /model_stats body and its ETag for the given hour"""
+    updated_at = datetime.fromtimestamp(hour_bucket * _HOUR)
+    models = {
+        model_id: {**info, "last_updated": updated_at - _MODEL_UPDATE_AGE[model_id]}
+        for model_id, info in _MODELS.items()
+    }
+    body = orjson.dumps({
+        "models": models,
+        "status": "success"
+    })
+    return body, _etag(body)
 
 # Command-line interface
 if __name__ == "__main__":
     # Set host and port
     HOST = os.getenv("FORECASTER_API_HOST", "0.0.0.0")
     PORT = int(os.getenv("FORECASTER_API_PORT", 8080))
-    DEBUG = os.getenv("FORECASTER_API_DEBUG", "True").lower() == "true"
+    DEBUG = os.getenv("FORECASTER_API_DEBUG", "False").lower() == "true"
     
-    # Start the Flask API server
+    # Start the Flask development server; production deployments should use
+    # gunicorn with gunicorn.conf.py (see start_forecaster.py)
     print(f"Starting Forecaster Market Data API on {HOST}:{PORT}")
     app.run(host=HOST, port=PORT, debug=DEBUG)
@@ -0,0 +1,15 @@
+"""Gunicorn configuration for the Forecaster Market Data API"""
+
+import os
+
+# Bind to the same host/port variables the development server uses
+bind = f"{os.getenv('FORECASTER_API_HOST', '0.0.0.0')}:{os.getenv('FORECASTER_API_PORT', '8080')}"
+
+# One process per core (plus headroom), each serving many requests on gevent greenlets
+workers = int(os.getenv("FORECASTER_API_WORKERS", 2 * (os.cpu_count() or 1) + 1))
+worker_class = "gevent"
+worker_connections = 1000
+keepalive = 30
+
+# Code reloading is opt-in for local development only
+reload = os.getenv("FORECASTER_API_RELOAD", "False").lower() == "true"
@@ -2,7 +2,6 @@
 
 import os
 import sys
-import subprocess
 
 # Set the current directory to the script's directory
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -12,19 +11,19 @@ def start_forecaster_api():
     """
     Starts the Forecaster Market Data API
     """
+    print("Starting Forecaster Market Data API...")
+    os.environ.setdefault("FORECASTER_API_PORT", "8080")
+    
+    # Replace this process with gunicorn so signals such as Ctrl-C reach
+    # the API server directly and no idle parent interpreter stays resident
     try:
-        print("Starting Forecaster Market Data API...")
-        os.environ["FORECASTER_API_DEBUG"] = "True"
-        os.environ["FORECASTER_API_PORT"] = "8080"
-        
-        # Run the API
-        subprocess.run([sys.executable, "api/market_data_api.py"], check=True)
-        
-    except subprocess.CalledProcessError as e:
+        os.execvp(
+            sys.executable,
+            [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "api.market_data_api:app"]
+        )
+    except OSError as e:
         print(f"Error starting Forecaster API: {e}")
         sys.exit(1)
-    except KeyboardInterrupt:
-        print("\nForecaster API stopped by user.")
 
 if __name__ == "__main__":
     start_forecaster_api()
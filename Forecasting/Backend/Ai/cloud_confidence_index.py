@@ -1,16 +1,29 @@
 #!/usr/bin/env python3
 import asyncio
+import atexit
+import copy
+import logging
 import os
-import json
+import queue
 import re
+import sys
+import orjson
+import numpy as np
 import math
 from pathlib import Path
 import textwrap
 import time
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+from functools import lru_cache, partial
+import httpx
 import structlog
+from cachetools import TTLCache
 from datetime import datetime
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+from quart import Quart, Response, request
+from quart_cors import cors
 
 from flare_ai_consensus.router import AsyncOpenRouterProvider
 from flare_ai_consensus.settings import Settings, Message
@@ -18,8 +31,10 @@ from flare_ai_consensus.utils import load_json
 
 # Import our custom confidence consensus components
 from flare_ai_consensus.consensus.confidence.confidence_embeddings import (
-    calculate_text_similarity, 
-    extract_price_and_explanation
+    calculate_text_similarities, 
+    extract_price_and_explanation,
+    gemini_available,
+    get_gemini_embedding
 )
 
 # Import sample data
@@ -31,33 +46,93 @@ from Backend.Ai.Sideinfo_api.sideinfo import main as get_nft_data
 # Load environment variables
 load_dotenv()
 
-# Initialize Flask app
-app = Flask(__name__)
-CORS(app)
+# Initialize Quart app (async Flask API) so the consensus handler runs on the server's event loop
+app = Quart(__name__)
+app = cors(app)
 
 ACCURACY_METRIC_DESIRED = True
 
-# Global variables for NFT data
-NFT_DATA = None
-ACTUAL_VALUE = None
-DATE_TO_PREDICT = None
+# Sideinfo API results by (contract_address, token_id), reused for five minutes
+_NFT_CACHE = TTLCache(maxsize=1024, ttl=300)
+
+# Serialized consensus results by (contract_address, token_id, date_to_predict), reused for an hour
+_CONSENSUS_CACHE = TTLCache(maxsize=1024, ttl=3600)
+# Consensus runs in progress, keyed like _CONSENSUS_CACHE, so concurrent duplicates can await them
+_INFLIGHT = {}
+
+# Semantic cache: unit embeddings of canonicalized NFT payloads and the serialized result for each.
+# Only used with Gemini embeddings; the word-count fallback vectors aren't comparable across texts
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_SIZE = 1024
+_SEMANTIC_VECTORS = []
+_SEMANTIC_RESULTS = []
+
+@dataclass
+class ConsensusCtx:
+    """Per-run NFT data, kept out of module globals so concurrent runs don't overwrite each other"""
+    actual_value: float
+    date_to_predict: str
+    nft_data: dict
+
+
+@dataclass(slots=True)
+class ModelResponse:
+    """One model's reply, parsed once when it arrives and shared by every later stage"""
+    model_id: str
+    text: str
+    price: float | None
+    explanation: str
+    tokens_used: int | None = None
+    latency: float = 0.0
+
+    @classmethod
+    def from_text(cls, model_id, text, tokens_used=None, latency=0.0):
+        price, explanation = properly_extract_json_price(text)
+        # Fall back to regex extraction if parsing fails
+        if price is None:
+            price, explanation = extract_price_and_explanation(text)
+        return cls(model_id, text, price, explanation or "", tokens_used, latency)
+
 
 # Parse data to compare accuracy
 def accuracy_preparation(json_data):
-    global ACTUAL_VALUE, DATE_TO_PREDICT, NFT_DATA
     if json_data["sales_history"]:
         most_recent_transaction = json_data["sales_history"].pop(0)  # Removes and stores the first (latest) entry
         formatted_date = datetime.strptime(most_recent_transaction["date"], "%Y-%m-%d %H:%M:%S").strftime("%B, %Y")
     
-    return most_recent_transaction["price_usd"], formatted_date, json_data
+    return ConsensusCtx(
+        actual_value=most_recent_transaction["price_usd"],
+        date_to_predict=formatted_date,
+        nft_data=json_data
+    )
+
+
+# Log level for structured logs; per-model diagnostics are logged at DEBUG
+LOG_LEVEL = getattr(logging, os.environ.get("CCI_LOG_LEVEL", "INFO").upper(), logging.INFO)
 
+# Rendered log lines are handed to a queue and written to stdout by a background thread,
+# so a slow terminal or pipe never blocks the event loop
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-# Configure structlog for better formatting
+_log_sink = logging.getLogger("cloud_confidence_index")
+_log_sink.addHandler(QueueHandler(_log_queue))
+_log_sink.setLevel(logging.DEBUG)
+_log_sink.propagate = False
+
+# Configure structlog for better formatting. The filtering logger turns calls below
+# LOG_LEVEL into no-ops before any processor or renderer runs
 structlog.configure(
     processors=[
+        structlog.contextvars.merge_contextvars,
         structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
         structlog.processors.JSONRenderer(indent=2, sort_keys=True)
-    ]
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(LOG_LEVEL),
+    logger_factory=lambda *args: _log_sink,
+    cache_logger_on_first_use=True
 )
 
 logger = structlog.get_logger()
@@ -71,28 +146,108 @@ CHALLENGE_PROMPTS = [
     "What factors might you have missed out on? Please reconsider your valuation with these factors in mind."
 ]
 
+# Static appraisal instructions, shared verbatim by every request; the date to
+# appraise at is sent in a separate message so this prefix never changes
+NFT_APPRAISAL_INSTRUCTIONS = """You are an expert at conducting NFT appraisals, and your goal is to output the price in USD value of the NFT at the specific date given in the next message. You will be given pricing history and other metadata about the NFT and will have to extrapolate and analyze the trends from the data. Your response MUST be in JSON format starting with a single value of price in USD, followed by a detailed explanation of your reasoning.
+
+            The sample data that you will be given will be in this input format, although the values will be different. Use it to understand how the data is laid out and what each entry means. Your analysis and appraisal should be more nuanced, smart, and data-driven than the example. 
+            
+            Your entire response/output is going to consist of a single JSON object, and you will NOT wrap it within JSON md markers
+
+            In the JSON, the price of Ethereum (price_ethereum) was how much Ethereum was paid at the time and the price in USD (price_usd) is the price of that Ethereum at the time of the sale in USD. 
+
+            Example Input:
+            {
+                "name": "Art Blocks",
+                "token_id": "78000956",
+                "token_address": "0xa7d8d9ef8d8ce8992df33d8b8cf4aebabd5bd270",
+                "metadata": {
+                    "symbol": "BLOCKS",
+                    "rarity_rank": "None",
+                    "rarity_percentage": "None",
+                    "amount": "1"
+                },
+                "sales_history": [
+                    {
+                        "price_ethereum": 24.61,
+                        "price_usd": 61914.7812,
+                        "date": "2025-03-03 17:49:35"
+                    },
+                    {
+                        "price_ethereum": 85.0,
+                        "price_usd": 108403.25579,
+                        "date": "2022-12-13 19:04:11"
+                    },
+                    {
+                        "price_ethereum": 0.17,
+                        "price_usd": 422.72201,
+                        "date": "2021-06-11 09:21:07"
+                    }
+                ]
+            }
+
+            Example Output:
+            {
+                "price": 67240,
+                "explanation": "Based on the sales history, the price of the NFT has been increasing over time. The most recent sale was for 24.61 ETH, which is worth $61914.7812 at the time of the sale. The previous sale was for 85 ETH, which is worth $108403.25579 at the time of the sale. The first sale was for 0.17 ETH, which is worth $422.72201 at the time of the sale. Based on this data, I estimate that the price of the NFT is currently $67240. Additional context on the rarity would help improve the response and the price estimate, however, with the given data, this seems a reasonable estimate for this date."
+            }
+            
+            """
+
+_INSTRUCTIONS_MESSAGE = {"role": "system", "content": NFT_APPRAISAL_INSTRUCTIONS}
+_USER_MESSAGE_TEMPLATE = "Your entire response/output is going to consist of a single JSON object, and you will NOT wrap it within JSON md markers. Here is the sample data: {}."
+
+@lru_cache(maxsize=64)
+def _date_message(date_to_predict):
+    """System message naming the appraisal date; most requests on a given day share one"""
+    return {"role": "system", "content": f"The date to appraise the NFT at is {date_to_predict}."}
+
+# Cancel the challenge round once the initial prices' coefficient of variation proves below this; 0 disables the skip
+CHALLENGE_CV_THRESHOLD = float(os.environ.get("CHALLENGE_CV_THRESHOLD", 0.05))
+
+# Upper bounds on concurrent OpenRouter requests across every run in the process, overall and per model
+CONSENSUS_MAX_INFLIGHT = int(os.environ.get("CONSENSUS_MAX_INFLIGHT", 8))
+CONSENSUS_MAX_INFLIGHT_PER_MODEL = int(os.environ.get("CONSENSUS_MAX_INFLIGHT_PER_MODEL", 2))
+
+# asyncio semaphores belong to one event loop, so each loop gets its own set
+_UPSTREAM_SEMAPHORES = weakref.WeakKeyDictionary()
+
+# Echo every outgoing request to the terminal, for debugging only
+DEBUG_REQUESTS = bool(os.environ.get("CCI_DEBUG"))
+CHAT_COMPLETIONS_ENDPOINT = "/chat/completions"
+
+# Patterns used to pull prices out of model responses, compiled once at import
+_RE_PRICE_JSON = re.compile(r'({[^{}]*"price"[^{}]*})')
+_RE_PRICE_KV = re.compile(r'"price"\s*:\s*([0-9,]+\.?[0-9]*)')
+_RE_EXPL_KV = re.compile(r'"explanation"\s*:\s*"([^"]+)"')
+_RE_DOLLAR = re.compile(r'\$([0-9,]+\.?[0-9]*)')
+
+# ANSI color codes for terminal output
+_COLORS = {
+    "red": "\033[91m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "blue": "\033[94m",
+    "magenta": "\033[95m",
+    "cyan": "\033[96m",
+}
+_RESET = "\033[0m"
+
 def print_colored(text, color=None):
     """Print text with ANSI color codes"""
-    colors = {
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "blue": "\033[94m",
-        "magenta": "\033[95m",
-        "cyan": "\033[96m",
-        "reset": "\033[0m"
-    }
-    
-    if color and color in colors:
-        print(f"{colors[color]}{text}{colors['reset']}")
+    code = _COLORS.get(color)
+    if code:
+        sys.stdout.write(f"{code}{text}{_RESET}\n")
     else:
-        print(text)
+        sys.stdout.write(f"{text}\n")
 
 
 def format_and_print_responses(responses, title="Model Responses"):
     """Format and print model responses nicely in the terminal"""
     terminal_width = 80
+    max_preview_chars = 500
     separator = "=" * terminal_width
+    interactive = sys.stdout.isatty()
     
     print(f"\n{separator}")
     print(f"{title.center(terminal_width)}")
@@ -101,22 +256,22 @@ def format_and_print_responses(responses, title="Model Responses"):
     for model_id, response in responses.items():
         print(f"Model: {model_id}")
         
-        # Ensure response is a string
-        response_text = convert_to_string(response)
-        
-        # Extract price and explanation from response
-        price, explanation = properly_extract_json_price(response_text)
-        if price is not None:
-            print(f"Extracted price: ${price:.2f}")
+        response_text = response.text
+        if response.price is not None:
+            print(f"Extracted price: ${response.price:.2f}")
         
-        # Format and wrap the response text
-        try:
-            wrapped_text = textwrap.fill(response_text, width=terminal_width-4)
-            indented_text = textwrap.indent(wrapped_text, "  ")
-            print(indented_text)
-        except Exception as e:
-            print(f"  Error formatting response: {e}")
-            print(f"  Raw response: {response_text[:500]}...")
+        # Wrapping is only worth it for a terminal preview; redirected output and
+        # CCI_DEBUG get the full body unwrapped and leave line breaks to the terminal
+        if not interactive or DEBUG_REQUESTS:
+            sys.stdout.write(f"{response_text}\n")
+        else:
+            # Wrap and indent only the bounded preview, in a single textwrap pass
+            preview = response_text if len(response_text) <= max_preview_chars else response_text[:max_preview_chars] + "..."
+            try:
+                print(textwrap.fill(preview, width=terminal_width-2, initial_indent="  ", subsequent_indent="  "))
+            except Exception as e:
+                print(f"  Error formatting response: {e}")
+                print(f"  Raw response: {response_text[:max_preview_chars]}...")
             
         print(f"{'-' * terminal_width}")
 
@@ -152,57 +307,53 @@ def properly_extract_json_price(text):
         tuple: (price as float or None, explanation as string or None)
     """
     # Clean up any potential code block markers
-    cleaned_text = text.strip()
-    if cleaned_text.startswith("```json"):
-        cleaned_text = re.sub(r'^```json\s*', '', cleaned_text)
-        cleaned_text = re.sub(r'\s*```$', '', cleaned_text)
-    elif cleaned_text.startswith("```"):
-        cleaned_text = re.sub(r'^```\s*', '', cleaned_text)
-        cleaned_text = re.sub(r'\s*```$', '', cleaned_text)
-    
-    # Try to parse as JSON
-    try:
-        # First try to parse the whole text
-        data = json.loads(cleaned_text)
-        if isinstance(data, dict):
-            # Extract price
-            if "price" in data:
+    cleaned_text = text.strip().removeprefix("```json").removeprefix("```").strip()
+    cleaned_text = cleaned_text.removesuffix("```").rstrip()
+    
+    # Only text that looks like a JSON object is worth handing to the JSON parser;
+    # anything else goes straight to the regex fallbacks below
+    if cleaned_text.startswith("{"):
+        try:
+            # First try to parse the whole text
+            data = orjson.loads(cleaned_text)
+            if isinstance(data, dict):
+                # Extract price
+                if "price" in data:
+                    try:
+                        price = float(data["price"])
+                        explanation = data.get("explanation", "")
+                        return price, explanation
+                    except (ValueError, TypeError):
+                        pass
+        except orjson.JSONDecodeError:
+            # If that fails, try to find and parse just the JSON part
+            match = _RE_PRICE_JSON.search(cleaned_text)
+            if match:
                 try:
-                    price = float(data["price"])
-                    explanation = data.get("explanation", "")
-                    return price, explanation
-                except (ValueError, TypeError):
+                    json_part = match.group(1)
+                    data = orjson.loads(json_part)
+                    if "price" in data:
+                        return float(data["price"]), data.get("explanation", "")
+                except ValueError:
                     pass
-    except json.JSONDecodeError:
-        # If that fails, try to find and parse just the JSON part
-        json_pattern = r'({[^{}]*"price"[^{}]*})'
-        match = re.search(json_pattern, cleaned_text)
-        if match:
-            try:
-                json_part = match.group(1)
-                data = json.loads(json_part)
-                if "price" in data:
-                    return float(data["price"]), data.get("explanation", "")
-            except (json.JSONDecodeError, ValueError):
-                pass
     
     # If JSON parsing fails, fall back to regex
     print_colored("JSON parsing failed, falling back to regex extraction", "yellow")
     
     # Look for {"price": 1234} pattern
-    price_match = re.search(r'"price"\s*:\s*([0-9,]+\.?[0-9]*)', text)
+    price_match = _RE_PRICE_KV.search(text)
     if price_match:
         try:
             price = float(price_match.group(1).replace(',', ''))
             # Try to extract explanation
-            explanation_match = re.search(r'"explanation"\s*:\s*"([^"]+)"', text)
+            explanation_match = _RE_EXPL_KV.search(text)
             explanation = explanation_match.group(1) if explanation_match else None
             return price, explanation
         except (ValueError, TypeError):
             pass
     
     # Look for dollar amounts as last resort
-    dollar_match = re.search(r'\$([0-9,]+\.?[0-9]*)', text)
+    dollar_match = _RE_DOLLAR.search(text)
     if dollar_match:
         try:
             price = float(dollar_match.group(1).replace(',', ''))
@@ -213,166 +364,267 @@ def properly_extract_json_price(text):
     return None, None
 
 
-async def patch_provider_for_logging(provider):
-    """Patch the provider's _post method to log request/response details"""
-    original_post = provider._post
+def _upstream_semaphores():
+    """Process-wide and per-model request limits for the running event loop"""
+    loop = asyncio.get_running_loop()
+    semaphores = _UPSTREAM_SEMAPHORES.get(loop)
+    if semaphores is None:
+        semaphores = (
+            asyncio.Semaphore(CONSENSUS_MAX_INFLIGHT),
+            defaultdict(lambda: asyncio.Semaphore(CONSENSUS_MAX_INFLIGHT_PER_MODEL))
+        )
+        _UPSTREAM_SEMAPHORES[loop] = semaphores
+    return semaphores
+
+
+async def _send_chat_completion(provider, payload):
+    """Send a chat completion with the model and endpoint bound to any log lines it emits"""
+    if DEBUG_REQUESTS:
+        print_colored(f"Request to {CHAT_COMPLETIONS_ENDPOINT}: max_tokens={payload.get('max_tokens')}", "blue")
+    total, per_model = _upstream_semaphores()
+    # Take the model's own slot first so requests queued behind a slow model don't hold shared slots
+    async with per_model[payload["model"]], total:
+        with structlog.contextvars.bound_contextvars(model=payload["model"], endpoint=CHAT_COMPLETIONS_ENDPOINT):
+            return await provider.send_chat_completion(payload)
+
+
+async def _request_model_response(provider, model, messages, label):
+    """Request one model's response, parse it and display it as soon as it comes in"""
+    model_id = model.model_id
+    
+    # Create payload
+    payload = {
+        "model": model_id,
+        "messages": messages,
+        "max_tokens": model.max_tokens,
+        "temperature": model.temperature,
+    }
+    
+    started = time.perf_counter()
+    try:
+        print_colored(f"Waiting for {model_id} to respond...", "blue")
+        response = await _send_chat_completion(provider, payload)
+        text = response.get("choices", [])[0].get("message", {}).get("content", "")
+        result = ModelResponse.from_text(
+            model_id, text,
+            tokens_used=(response.get("usage") or {}).get("completion_tokens"),
+            latency=time.perf_counter() - started
+        )
+        
+        # Immediately display this model's response
+        print_colored(f"\n----- {label} from {model_id} -----", "green")
+        
+        if result.price is not None:
+            print_colored(f"Extracted price: ${result.price:.2f}", "cyan")
+        
+        # Show truncated response
+        max_preview_chars = 500
+        preview = text if len(text) <= max_preview_chars else text[:max_preview_chars] + "..."
+        print(preview)
+        print_colored("-" * 40, "green")
+        
+    except Exception as e:
+        logger.error(f"Error getting response from {model_id}: {e}")
+        result = ModelResponse.from_text(model_id, f"Error: {str(e)}", latency=time.perf_counter() - started)
+        print_colored(f"Error getting response from {model_id}: {e}", "red")
     
-    async def logged_post(endpoint, json_payload):
-        logger.info("API request", endpoint=endpoint, max_tokens=json_payload.get('max_tokens'))
-        print_colored(f"Request to {endpoint}: max_tokens={json_payload.get('max_tokens')}", "blue")
-        response = await original_post(endpoint, json_payload)
-        logger.info("API response received", endpoint=endpoint, status="success")
-        return response
+    return result
+
+
+def _unique_models(models):
+    """
+    Collapse repeated model entries into one request per model_id.
     
-    provider._post = logged_post
-    return provider
+    Responses are stored per model_id, so a duplicate entry would only cost an extra
+    request whose answer overwrites the first one.
+    """
+    return list({model.model_id: model for model in models}.values())
 
 
 async def send_initial_round(provider, consensus_config, initial_conversation):
-    """Get initial responses from all models and display responses as they come in"""
+    """Get initial responses from all models concurrently and display responses as they come in"""
     logger.info("Getting initial responses from models")
-    initial_responses = {}
-    
-    for model in consensus_config.models:
-        model_id = model.model_id
-        print_colored(f"Requesting initial response from {model_id}...", "blue")
-        
-        # Create payload
-        payload = {
-            "model": model_id,
-            "messages": initial_conversation,
-            "max_tokens": model.max_tokens,
-            "temperature": model.temperature,
-        }
-        
-        # Send request and immediately show response (no concurrent processing)
-        try:
-            print_colored(f"Waiting for {model_id} to respond...", "blue")
-            response = await provider.send_chat_completion(payload)
-            text = response.get("choices", [])[0].get("message", {}).get("content", "")
-            initial_responses[model_id] = text
-            
-            # Immediately display this model's response
-            print_colored(f"\n----- Initial Response from {model_id} -----", "green")
-            
-            # Extract price and explanation
-            price, explanation = properly_extract_json_price(text)
-            if price is not None:
-                print_colored(f"Extracted price: ${price:.2f}", "cyan")
-            
-            # Show truncated response
-            max_preview_chars = 500
-            preview = text if len(text) <= max_preview_chars else text[:max_preview_chars] + "..."
-            print(preview)
-            print_colored("-" * 40, "green")
-            
-        except Exception as e:
-            logger.error(f"Error getting response from {model_id}: {e}")
-            error_msg = f"Error: {str(e)}"
-            initial_responses[model_id] = error_msg
-            print_colored(f"Error getting response from {model_id}: {e}", "red")
-        
-    return initial_responses
+    
+    tasks = []
+    for model in _unique_models(consensus_config.models):
+        print_colored(f"Requesting initial response from {model.model_id}...", "blue")
+        tasks.append(_request_model_response(
+            provider, model, initial_conversation, "Initial Response"
+        ))
+    
+    # Total latency is that of the slowest model rather than the sum of all of them
+    return {response.model_id: response for response in await asyncio.gather(*tasks)}
 
 
-async def send_challenge_round(provider, consensus_config, initial_conversation, challenge_prompt, initial_responses):
-    """Send challenge prompts to all models and display responses as they come in"""
-    logger.info("Sending challenge prompts to models")
-    challenge_responses = {}
-    
-    for model in consensus_config.models:
-        model_id = model.model_id
-        print_colored(f"Sending challenge to {model_id}...", "blue")
-        
-        # Get the model's original response and extract price
-        original_response = initial_responses.get(model_id, "")
-        
-        # Create contextual challenge prompt that includes original response
-        contextualized_prompt = f"""
-        Your previous price estimation analysis was was {original_response}.
+def _build_challenge_conversation(initial_conversation, challenge_prompt, original_response):
+    """Extend the initial conversation with a challenge that quotes the model's original response"""
+    # Create contextual challenge prompt that includes original response
+    contextualized_prompt = f"""
+        Your previous price estimation analysis was was {original_response.text if original_response else ""}.
 
         {challenge_prompt}
 
         Remember to maintain the same JSON format with 'price' and 'explanation' fields.
         """
-        
-        print(contextualized_prompt)
-        
-        # Build conversation with challenge
-        conversation = initial_conversation.copy()
-        conversation.append({"role": "user", "content": contextualized_prompt})
-        
-        # Create payload
-        payload = {
-            "model": model_id,
-            "messages": conversation,
-            "max_tokens": model.max_tokens,
-            "temperature": model.temperature,
-        }
-        
-        # Send request and immediately show response (no concurrent processing)
-        try:
-            print_colored(f"Waiting for {model_id} to respond...", "blue")
-            response = await provider.send_chat_completion(payload)
-            text = response.get("choices", [])[0].get("message", {}).get("content", "")
-            challenge_responses[model_id] = text
-            
-            # Immediately display this model's response
-            print_colored(f"\n----- Response from {model_id} -----", "green")
-            
-            # Extract price and explanation
-            price, explanation = properly_extract_json_price(text)
-            if price is not None:
-                print_colored(f"Extracted price: ${price:.2f}", "cyan")
+    
+    print(contextualized_prompt)
+    
+    # Build conversation with challenge; the base conversation is shared, never mutated
+    return initial_conversation + [{"role": "user", "content": contextualized_prompt}]
+
+
+async def send_challenge_round(provider, consensus_config, initial_conversation, challenge_prompts, initial_responses):
+    """
+    Send every challenge prompt to every model concurrently and display responses as they come in.
+    
+    Returns:
+        dict: prompt index -> {model_id: ModelResponse}
+    """
+    logger.info("Sending challenge prompts to models")
+    
+    async def challenge(prompt_idx, model, conversation):
+        response = await _request_model_response(
+            provider, model, conversation, "Response"
+        )
+        return prompt_idx, response
+    
+    tasks = []
+    for prompt_idx, challenge_prompt in enumerate(challenge_prompts):
+        for model in _unique_models(consensus_config.models):
+            model_id = model.model_id
+            print_colored(f"Sending challenge to {model_id}...", "blue")
             
-            # Show truncated response
-            max_preview_chars = 500
-            preview = text if len(text) <= max_preview_chars else text[:max_preview_chars] + "..."
-            print(preview)
-            print_colored("-" * 40, "green")
+            # Get the model's original response and build the challenge around it
+            original_response = initial_responses.get(model_id)
+            conversation = _build_challenge_conversation(initial_conversation, challenge_prompt, original_response)
             
-        except Exception as e:
-            logger.error(f"Error getting challenge response from {model_id}: {e}")
-            error_msg = f"Error: {str(e)}"
-            challenge_responses[model_id] = error_msg
-            print_colored(f"Error getting response from {model_id}: {e}", "red")
+            tasks.append(challenge(prompt_idx, model, conversation))
+    
+    challenge_responses = {prompt_idx: {} for prompt_idx in range(len(challenge_prompts))}
+    for prompt_idx, response in await asyncio.gather(*tasks):
+        challenge_responses[prompt_idx][response.model_id] = response
     
     return challenge_responses
 
 
+async def send_initial_and_challenge_rounds(provider, consensus_config, initial_conversation, challenge_prompt,
+                                            cv_threshold=0):
+    """
+    Run the initial and challenge rounds as one pipeline per model.
+    
+    A model's challenge only depends on its own initial response, so it is sent as soon
+    as that response arrives instead of waiting for the slowest model's initial response.
+    Once every initial response is in, the challenges still in flight are cancelled if the
+    initial prices' coefficient of variation is below cv_threshold (0 never cancels).
+    
+    Returns:
+        tuple: ({model_id: initial ModelResponse}, {model_id: challenge ModelResponse}),
+        with None for the challenge responses when they were cancelled
+    """
+    logger.info("Getting initial and challenge responses from models")
+    models = _unique_models(consensus_config.models)
+    
+    initial_tasks = []
+    for model in models:
+        print_colored(f"Requesting initial response from {model.model_id}...", "blue")
+        initial_tasks.append(asyncio.create_task(_request_model_response(
+            provider, model, initial_conversation, "Initial Response"
+        )))
+    
+    async def challenge(model, initial_task):
+        initial = await initial_task
+        print_colored(f"Sending challenge to {model.model_id}...", "blue")
+        conversation = _build_challenge_conversation(initial_conversation, challenge_prompt, initial)
+        return await _request_model_response(provider, model, conversation, "Response")
+    
+    challenge_tasks = [
+        asyncio.create_task(challenge(model, initial_task))
+        for model, initial_task in zip(models, initial_tasks)
+    ]
+    
+    try:
+        initial_responses = {
+            response.model_id: response for response in await asyncio.gather(*initial_tasks)
+        }
+        
+        spread = _initial_price_spread(initial_responses) if cv_threshold > 0 else None
+        if spread is not None and spread < cv_threshold:
+            # The models already agree, so the challenges would add no information
+            print_colored(f"\nInitial prices agree (CV {spread:.2%}), cancelling challenges", "green")
+            return initial_responses, None
+        
+        challenge_responses = {
+            response.model_id: response for response in await asyncio.gather(*challenge_tasks)
+        }
+        return initial_responses, challenge_responses
+    finally:
+        # Requests still pending here were skipped or orphaned by an error or cancellation
+        for task in initial_tasks + challenge_tasks:
+            task.cancel()
+        await asyncio.gather(*initial_tasks, *challenge_tasks, return_exceptions=True)
+
+
+def _initial_price_spread(initial_responses):
+    """Coefficient of variation of the initial prices, or None if fewer than two could be parsed"""
+    prices = [response.price for response in initial_responses.values() if response.price is not None]
+    if len(prices) < 2:
+        return None
+    prices = np.asarray(prices, dtype=float)
+    mean_price = prices.mean()
+    return float(prices.std(ddof=1) / mean_price) if mean_price else None
+
+
+def _unchallenged_analysis(initial_responses):
+    """Analysis for a skipped challenge round: every model held its answer, so all weigh equally"""
+    analysis = {}
+    for model_id, response in initial_responses.items():
+        price = response.price
+        if price is None:
+            print_colored(f"Skipping analysis for {model_id} due to missing responses", "red")
+            continue
+        analysis[model_id] = {
+            "initial_price": price,
+            "challenge_price": price,
+            "price_change": 0,
+            "price_stability": 1,
+            "text_similarity": 1.0,
+            "confidence_score": 1.0
+        }
+    return analysis
+
+
 async def analyze_model_responses(initial_responses, challenge_responses):
-    """Analyze how models respond to challenges"""
+    """
+    Analyze how models respond to challenges.
+    
+    Parsing and scoring are CPU-bound and the similarity embeddings are fetched with a
+    blocking client, so the analysis runs on a worker thread to keep the event loop free.
+    """
+    return await asyncio.to_thread(_analyze_model_responses, initial_responses, challenge_responses)
+
+
+def _analyze_model_responses(initial_responses, challenge_responses):
     analysis = {}
+    extracted = []
     
     for model_id in initial_responses:
-        # Get initial and challenge responses
-        initial = initial_responses.get(model_id, "")
-        challenge = challenge_responses.get(model_id, "")
+        # Get initial and challenge responses, parsed when they arrived
+        initial = initial_responses.get(model_id)
+        challenge = challenge_responses.get(model_id)
         
         # Skip if either response is missing
-        if not initial or not challenge:
+        if not initial or not challenge or not initial.text or not challenge.text:
             print_colored(f"Skipping analysis for {model_id} due to missing responses", "red")
             continue
-            
-        # Extract prices and explanations using proper JSON parsing
-        initial_price, initial_explanation = properly_extract_json_price(initial)
-        challenge_price, challenge_explanation = properly_extract_json_price(challenge)
-        
-        # Fall back to regex extraction if parsing fails
-        if initial_price is None:
-            tmp_price, tmp_explanation = extract_price_and_explanation(initial)
-            initial_price = tmp_price
-            initial_explanation = tmp_explanation or ""
-            
-        if challenge_price is None:
-            tmp_price, tmp_explanation = extract_price_and_explanation(challenge)
-            challenge_price = tmp_price
-            challenge_explanation = tmp_explanation or ""
-        
-        # Ensure we have explanation strings
-        initial_explanation = initial_explanation or ""
-        challenge_explanation = challenge_explanation or ""
         
+        extracted.append((model_id, initial.price, challenge.price, initial.explanation, challenge.explanation))
+    
+    # Calculate text similarity for every model in a single batch
+    text_similarities = calculate_text_similarities(
+        [(initial_explanation, challenge_explanation) for _, _, _, initial_explanation, challenge_explanation in extracted]
+    )
+    
+    for (model_id, initial_price, challenge_price, _, _), text_similarity in zip(extracted, text_similarities):
         # Calculate price change with improved formula
         if initial_price == 0 and challenge_price == 0:
             price_change = 0
@@ -382,15 +634,9 @@ async def analyze_model_responses(initial_responses, challenge_responses):
             # Calculate relative price change
             price_change = min(abs(challenge_price - initial_price) / initial_price, 1)
             
-            
-     
-            
         # Calculate price stability (inverse of price change)
         price_stability = 1 - price_change
         
-        # Calculate text similarity
-        text_similarity = calculate_text_similarity(initial_explanation, challenge_explanation)
-        
         # Calculate confidence score using weighted formula
         # 30% weight on text similarity, 70% on price stability
         confidence_score = (0.3 * text_similarity) + (0.7 * price_stability)
@@ -409,63 +655,79 @@ async def analyze_model_responses(initial_responses, challenge_responses):
         }
         
         
-        # Log results
-        print_colored(f"\nModel: {model_id}", "yellow")
-        print_colored(f"Initial price: ${initial_price:.2f}", "cyan")
-        print_colored(f"Challenge price: ${challenge_price:.2f}", "cyan")
-        print_colored(f"Raw change: {abs(challenge_price - initial_price) / max(initial_price, 1):.2%}", "cyan")
-        print_colored(f"Price change: {price_change:.2%}", "magenta")
-        print_colored(f"Price stability: {price_stability:.4f}", "magenta")
-        print_colored(f"Text similarity: {text_similarity:.4f}", "magenta")
-        print_colored(f"Formula: 0.3 * {text_similarity:.4f} + 0.7 * {price_stability:.4f} = {confidence_score:.4f}", "blue")
-        print_colored(f"Confidence score: {confidence_score:.4f}", "green")
+        # Log results; nothing is formatted unless DEBUG logging is enabled
+        logger.debug(
+            "Model response analysis",
+            model=model_id,
+            initial_price=initial_price,
+            challenge_price=challenge_price,
+            price_change=price_change,
+            price_stability=price_stability,
+            text_similarity=text_similarity,
+            confidence_score=confidence_score
+        )
         
     return analysis
 
 
-async def weighted_aggregation(provider, aggregator_config, model_responses, analysis):
+# Final instruction to the aggregator; it does not depend on the analysis, so it is built once
+_AGGREGATOR_PROMPT = {
+    "role": "user",
+    "content": """Based on the model responses and their assigned confidence weights, provide your final appraisal of the NFT's value.
+
+Your response MUST be in JSON format with the following structure:
+{
+  "price": [Final price in USD as a number],
+  "explanation": "[Brief explanation in 2-3 sentences]"
+}
+
+Important guidelines:
+1. Instead, use your expertise to determine the most reasonable price based on:
+   - The quality of each model's reasoning
+   - The confidence weights assigned to each model
+   - Recent sales data emphasized in the responses
+   - The NFT's rarity and market trends
+2. Your price should reflect your best judgment of the true value, informed by the weighted model responses
+3. Your explanation should be concise but informative
+
+Do not include any text outside the JSON structure or any markdown code blocks.
+"""
+}
+
+
+async def weighted_aggregation(provider, aggregator_config, model_responses, analysis, ctx):
     """
     Provide aggregator model with confidence scores and let it determine the final price.
     We don't calculate a weighted average ourselves, but instead pass the weights to the model.
     """
-    global ACTUAL_VALUE
     # Calculate weights based on confidence scores
-    confidence_scores = {model_id: data["confidence_score"] for model_id, data in analysis.items()}
-    
-    # Calculate total confidence for normalization
-    total_confidence = sum(confidence_scores.values())
+    model_ids = list(analysis)
+    confidence_scores = np.fromiter(
+        (analysis[model_id]["confidence_score"] for model_id in model_ids),
+        dtype=np.float64,
+        count=len(model_ids)
+    )
     
-    # Normalize weights to ensure they sum to 1
+    # Normalize weights to ensure they sum to 1; a single division needs no further correction
+    total_confidence = confidence_scores.sum()
     if total_confidence > 0:
-        weights = {model_id: score / total_confidence for model_id, score in confidence_scores.items()}
+        weight_values = confidence_scores / total_confidence
     else:
         # Equal weights if all confidence scores are 0
-        weight = 1.0 / max(len(confidence_scores), 1)
-        weights = {model_id: weight for model_id in confidence_scores}
-    
-    # Verify that weights sum to 1
-    weight_sum = sum(weights.values())
-    print_colored(f"Total weight sum: {weight_sum:.6f}", "blue")
+        weight_values = np.full(len(model_ids), 1.0 / max(len(model_ids), 1))
+    weights = dict(zip(model_ids, weight_values.tolist()))
+    print_colored(f"Total weight sum: {weight_values.sum():.6f}", "blue")
     
-    # Apply a small correction if needed due to floating point errors
-    if abs(weight_sum - 1.0) > 0.000001:
-        correction_factor = 1.0 / weight_sum
-        weights = {model_id: w * correction_factor for model_id, w in weights.items()}
-        print_colored(f"Applied correction factor: {correction_factor}", "yellow")
-        print_colored(f"New weight sum: {sum(weights.values()):.6f}", "blue")
+    challenge_prices = {model_id: data["challenge_price"] for model_id, data in analysis.items()}
     
     # Calculate standard statistics for informational purposes only
-    prices = [analysis[model_id]["challenge_price"] for model_id in analysis]
-    if prices:
-        valid_prices = [p for p in prices if p is not None and p > 0]
-        if valid_prices:
-            mean_price = statistics.mean(valid_prices)
-            median_price = statistics.median(valid_prices)
-            std_dev = statistics.stdev(valid_prices) if len(valid_prices) > 1 else 0
-        else:
-            mean_price = 0
-            median_price = 0
-            std_dev = 0
+    # Missing prices become NaN and are dropped along with non-positive ones
+    prices = np.array(list(challenge_prices.values()), dtype=np.float64)
+    valid_prices = prices[prices > 0]
+    if valid_prices.size:
+        mean_price = float(valid_prices.mean())
+        median_price = float(np.median(valid_prices))
+        std_dev = float(valid_prices.std(ddof=1)) if valid_prices.size > 1 else 0
     else:
         mean_price = 0
         median_price = 0
@@ -473,13 +735,10 @@ async def weighted_aggregation(provider, aggregator_config, model_responses, ana
         
     
     # Log the normalized weights and prices
-    print_colored("\nModel Weights and Prices:", "cyan")
-    for model_id, weight in weights.items():
-        if model_id in analysis:
-            price = analysis[model_id]["challenge_price"]
-            print_colored(f"Model: {model_id}", "cyan")
-            print_colored(f"- Weight: {weight:.4f}", "blue") 
-            print_colored(f"- Price: ${price:.2f}", "blue")
+    if logger.is_enabled_for(logging.DEBUG):
+        for model_id, weight in weights.items():
+            if model_id in challenge_prices:
+                logger.debug("Model weight", model=model_id, weight=weight, price=challenge_prices[model_id])
     
     print_colored(f"\nStatistics (for information only):", "cyan")
     print_colored(f"Mean price: ${mean_price:.2f}", "cyan")
@@ -487,15 +746,11 @@ async def weighted_aggregation(provider, aggregator_config, model_responses, ana
     print_colored(f"Standard deviation: ${std_dev:.2f}", "cyan")
     
     # Create weighted aggregation text for the aggregator
-    weighted_responses_text = []
-    for model_id, challenge_response in model_responses.items():
-        if model_id in weights and model_id in analysis:
-            weight = weights[model_id]
-            price = analysis[model_id]["challenge_price"]
-            response_text = f"Model: {model_id} (Weight: {weight:.4f}, Price: ${price:.2f})\n{challenge_response}"
-            weighted_responses_text.append(response_text)
-    
-    weighted_text = "\n\n---\n\n".join(weighted_responses_text)
+    weighted_text = "\n\n---\n\n".join(
+        f"Model: {model_id} (Weight: {weights[model_id]:.4f}, Price: ${challenge_prices[model_id]:.2f})\n{challenge_response.text}"
+        for model_id, challenge_response in model_responses.items()
+        if model_id in weights and model_id in challenge_prices
+    )
     
     # Build messages for the aggregator
     messages = []
@@ -514,29 +769,7 @@ async def weighted_aggregation(provider, aggregator_config, model_responses, ana
     messages.append(system_message)
     
     # Add aggregator prompt with explicit JSON structure requirement
-    aggregator_prompt = {
-        "role": "user",
-        "content": """Based on the model responses and their assigned confidence weights, provide your final appraisal of the NFT's value.
-
-Your response MUST be in JSON format with the following structure:
-{
-  "price": [Final price in USD as a number],
-  "explanation": "[Brief explanation in 2-3 sentences]"
-}
-
-Important guidelines:
-1. Instead, use your expertise to determine the most reasonable price based on:
-   - The quality of each model's reasoning
-   - The confidence weights assigned to each model
-   - Recent sales data emphasized in the responses
-   - The NFT's rarity and market trends
-2. Your price should reflect your best judgment of the true value, informed by the weighted model responses
-3. Your explanation should be concise but informative
-
-Do not include any text outside the JSON structure or any markdown code blocks.
-"""
-    }
-    messages.append(aggregator_prompt)
+    messages.append(_AGGREGATOR_PROMPT)
     
     # Send request to the aggregator model
     payload = {
@@ -548,20 +781,16 @@ Do not include any text outside the JSON structure or any markdown code blocks.
     
     print_colored(f"Sending aggregation request to {aggregator_config.model.model_id}...", "blue")
     
-    response = await provider.send_chat_completion(payload)
+    response = await _send_chat_completion(provider, payload)
     aggregated_text = response.get("choices", [])[0].get("message", {}).get("content", "")
     
     # Clean up JSON if needed
-    aggregated_text = aggregated_text.strip()
-    if aggregated_text.startswith('```json'):
-        aggregated_text = re.sub(r'^```json\s*', '', aggregated_text)
-    if aggregated_text.endswith('```'):
-        aggregated_text = re.sub(r'\s*```$', '', aggregated_text)
-    aggregated_text = aggregated_text.strip()
+    aggregated_text = aggregated_text.strip().removeprefix("```json").removeprefix("```").strip()
+    aggregated_text = aggregated_text.removesuffix("```").rstrip()
     
     # Try to parse the JSON to validate it
     try:
-        result_json = json.loads(aggregated_text)
+        result_json = orjson.loads(aggregated_text)
         
         # Ensure we have the basic required fields
         if "price" not in result_json:
@@ -575,18 +804,14 @@ Do not include any text outside the JSON structure or any markdown code blocks.
         result_json["models"] = {}
         
         predicted_price = result_json["price"]
-        error_accuracy = abs((ACTUAL_VALUE - predicted_price)) / ACTUAL_VALUE
-        if 1 - error_accuracy < 0:
-            accuracy = 0
-        else:
-            accuracy = 1 - error_accuracy
+        accuracy = prediction_accuracy(predicted_price, ctx.actual_value)
         
         print_colored(f"Predicted Price: ${predicted_price:.2f}", "green")
-        print_colored(f"Actual Price: ${ACTUAL_VALUE:.2f}", "green")
+        print_colored(f"Actual Price: ${ctx.actual_value:.2f}", "green")
         print_colored(f"Accuracy: {accuracy:.2%}", "green")
         
         result_json["accuracy"] = accuracy
-        result_json["actual_value"] = ACTUAL_VALUE
+        result_json["actual_value"] = ctx.actual_value
         
         for model_id, data in analysis.items():
             result_json["models"][model_id] = {
@@ -596,25 +821,22 @@ Do not include any text outside the JSON structure or any markdown code blocks.
             }
             
         # Add Final Confidence score and Standard Deviation of Weights
-        weights = [weights.get(model_id, 0) for model_id in analysis]
-        print("WEIGHTS: ", weights)
+        # weight_values is kept separate from the weights dict, which the fallback below still indexes by model_id
+        print("WEIGHTS: ", weight_values.tolist())
         
-        if weights and len(weights) > 1:
-            weights_std_dev = statistics.stdev(weights)
-            cv = weights_std_dev / (sum(weights) / len(weights) )
+        if weight_values.size > 1:
+            weights_std_dev = float(weight_values.std(ddof=1))
+            mean_weight = float(weight_values.mean())
+            cv = weights_std_dev / mean_weight if mean_weight else 0.0
             confidence = 1.0 - min(cv, 1.0)
             final_confidence = max(0.1, min(0.9, confidence))
         
             result_json["final_confidence_score"] = final_confidence
             result_json["weights_standard_deviation"] = weights_std_dev
             
-        result_json["actual_value"] = ACTUAL_VALUE
-        
-            
-        # Convert back to JSON string
-        aggregated_text = json.dumps(result_json, indent=2)
+        result_json["actual_value"] = ctx.actual_value
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print_colored(f"Error parsing aggregator response as JSON: {e}", "red")
         print_colored("Creating fallback JSON output", "yellow")
         
@@ -633,20 +855,148 @@ Do not include any text outside the JSON structure or any markdown code blocks.
             "standard_deviation": std_dev,
             "models": models_json
         }
-        
-        aggregated_text = json.dumps(result_json, indent=2)
     
-    return aggregated_text
+    # Hand back the dict itself; callers serialize it once for wherever it goes
+    return result_json
+
+
+def _report_saved_result(results_file, future):
+    """Report the outcome of a background write of the consensus result"""
+    if future.cancelled():
+        return
+    if future.exception() is not None:
+        print_colored(f"Error saving consensus result to {results_file}: {future.exception()}", "red")
+    else:
+        print_colored(f"\nSaved consensus result to {results_file}", "green")
+
+
+@lru_cache(maxsize=4)
+def _load_settings(config_file, mtime):
+    """Build settings with the consensus configuration; mtime is part of the cache key so edits invalidate it"""
+    settings = Settings()
+    config_json = load_json(Path(config_file))
+    settings.load_consensus_config(config_json)
+    return settings
+
+
+def canonicalize_nft_data(nft_data):
+    """Reduce NFT data to the fields that drive an appraisal, in a stable order, for embedding"""
+    sales = sorted(
+        (
+            {"date": sale["date"], "price_ethereum": round(sale["price_ethereum"], 4), "price_usd": round(sale["price_usd"], 2)}
+            for sale in nft_data.get("sales_history", [])
+        ),
+        key=lambda sale: sale["date"],
+        reverse=True
+    )
+    canonical = {
+        "name": nft_data.get("name"),
+        "metadata": nft_data.get("metadata"),
+        "sales_history": sales
+    }
+    return orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS).decode()
+
+
+def semantic_cache_lookup(vector):
+    """Return the cached result whose NFT payload is most similar to vector, if above the threshold"""
+    # Only vectors of the query's size are comparable with it
+    candidates = [i for i, cached in enumerate(_SEMANTIC_VECTORS) if cached.shape == vector.shape]
+    if not candidates:
+        return None
+    # Vectors are unit length, so one matrix-vector product gives every cosine similarity
+    scores = np.stack([_SEMANTIC_VECTORS[i] for i in candidates]) @ vector
+    best = int(scores.argmax())
+    if scores[best] < SEMANTIC_CACHE_THRESHOLD:
+        return None
+    print_colored(f"Semantic cache hit (similarity {scores[best]:.4f})", "green")
+    return _SEMANTIC_RESULTS[candidates[best]]
 
 
-async def run_confidence_consensus(contract_address, token_id, date_to_predict=None, actual_value=None):
-    """Run the confidence consensus process for a given NFT data"""
+def semantic_cache_add(vector, result_bytes):
+    """Remember a result for its NFT payload embedding, dropping the oldest entry when full"""
+    if len(_SEMANTIC_VECTORS) >= SEMANTIC_CACHE_SIZE:
+        _SEMANTIC_VECTORS.pop(0)
+        _SEMANTIC_RESULTS.pop(0)
+    _SEMANTIC_VECTORS.append(vector)
+    _SEMANTIC_RESULTS.append(result_bytes)
+
+
+def prediction_accuracy(predicted_price, actual_value):
+    """Accuracy of a predicted price as 1 - relative error, floored at 0"""
+    error_accuracy = abs((actual_value - predicted_price)) / actual_value
+    if 1 - error_accuracy < 0:
+        return 0
+    return 1 - error_accuracy
+
+
+async def run_confidence_consensus(contract_address, token_id, date_to_predict=None, actual_value=None, provider=None, force_refresh=False):
+    """
+    Run the confidence consensus process for a given NFT data.
+    
+    A long-lived provider can be passed in to reuse its HTTP connections across runs;
+    otherwise a provider is created for this run and closed when it finishes.
+    Results are cached for an hour per NFT and date unless force_refresh is set.
+    Concurrent calls for the same NFT and date share a single run.
+    """
+    result_key = (contract_address, token_id, date_to_predict or "now")
+    
+    # Join a run that is already in progress for this NFT instead of starting another
+    inflight = _INFLIGHT.get(result_key)
+    if inflight is not None:
+        print_colored(f"Waiting on in-flight consensus run for {contract_address}/{token_id}", "green")
+        return copy.deepcopy(await asyncio.shield(inflight))
+    
+    # The run is a task of its own, shielded from every caller, so cancelling the request
+    # that started it (a client disconnect) leaves it running for the requests that joined
+    task = asyncio.create_task(
+        _run_confidence_consensus(result_key, contract_address, token_id, date_to_predict, provider, force_refresh)
+    )
+    _INFLIGHT[result_key] = task
+    task.add_done_callback(partial(_finish_inflight, result_key))
+    return await asyncio.shield(task)
+
+
+def _finish_inflight(result_key, task):
+    """Forget a finished consensus run so the next call for its NFT starts afresh"""
+    if _INFLIGHT.get(result_key) is task:
+        del _INFLIGHT[result_key]
+    # Mark the exception as retrieved so a run whose callers all left doesn't log a warning
+    if not task.cancelled():
+        task.exception()
+
+
+async def _run_confidence_consensus(result_key, contract_address, token_id, date_to_predict, provider, force_refresh):
     import random
     
-    # Get NFT data from sideinfo API and set global variables
-    global NFT_DATA, ACTUAL_VALUE, DATE_TO_PREDICT
-    NFT_DATA = get_nft_data(contract_address, token_id)
-    ACTUAL_VALUE, DATE_TO_PREDICT, NFT_DATA = accuracy_preparation(NFT_DATA)
+    # Serve a recent result for the same NFT without any model calls
+    cached = None if force_refresh else _CONSENSUS_CACHE.get(result_key)
+    if cached is not None:
+        print_colored(f"Returning cached consensus result for {contract_address}/{token_id}", "green")
+        return orjson.loads(cached)
+    
+    # Get NFT data from sideinfo API
+    key = (contract_address, token_id)
+    nft_data = _NFT_CACHE.get(key)
+    if nft_data is None:
+        # The Sideinfo client is synchronous; run it off the event loop so concurrent
+        # requests on the same server keep making progress
+        nft_data = await asyncio.to_thread(get_nft_data, contract_address, token_id)
+        _NFT_CACHE[key] = nft_data
+    # accuracy_preparation pops the latest sale, so work on a copy of the cached data
+    ctx = accuracy_preparation(copy.deepcopy(nft_data))
+    
+    # Reuse the appraisal of a near-identical NFT, re-scored against this NFT's actual value
+    semantic_vector = None
+    if gemini_available and not force_refresh:
+        # None when Gemini fails; the fallback embeddings aren't comparable, so the cache is skipped
+        semantic_vector = await asyncio.to_thread(get_gemini_embedding, canonicalize_nft_data(ctx.nft_data))
+        similar = semantic_cache_lookup(semantic_vector) if semantic_vector is not None else None
+        if similar is not None:
+            result = orjson.loads(similar)
+            if "accuracy" in result:
+                result["accuracy"] = prediction_accuracy(result["price"], ctx.actual_value)
+                result["actual_value"] = ctx.actual_value
+            return result
     
     # Load API key from environment variable
     api_key = os.environ.get("OPEN_ROUTER_API_KEY", "")
@@ -655,9 +1005,6 @@ async def run_confidence_consensus(contract_address, token_id, date_to_predict=N
         print("Please set your OpenRouter API key in your .env file")
         return {"error": "API key not set"}
 
-    # Initialize the settings
-    settings = Settings()
-    
     # Create paths for configuration and data
     config_path = Path("config")
     config_path.mkdir(exist_ok=True)
@@ -665,79 +1012,30 @@ async def run_confidence_consensus(contract_address, token_id, date_to_predict=N
     # Load or create the consensus configuration
     config_file = config_path / "consensus_config.json"
            
-    # Load the configuration
-    config_json = load_json(config_file)
-    settings.load_consensus_config(config_json)
-    
-    # Create the OpenRouter provider
-    provider = AsyncOpenRouterProvider(
-        api_key=api_key,
-        base_url=settings.open_router_base_url
-    )
+    # Load the configuration, re-reading the file only when it has been edited
+    settings = _load_settings(str(config_file), config_file.stat().st_mtime)
     
-    # Patch the provider for better logging
-    provider = await patch_provider_for_logging(provider)
+    # Create the OpenRouter provider unless the caller shares one
+    owns_provider = provider is None
+    if owns_provider:
+        provider = AsyncOpenRouterProvider(
+            api_key=api_key,
+            base_url=settings.open_router_base_url
+        )
     
     # Use the most recent date from sales history if date_to_predict is not provided
-    if not date_to_predict and NFT_DATA.get("sales_history"):
-        most_recent_date = NFT_DATA["sales_history"][0]["date"]
+    if not date_to_predict and ctx.nft_data.get("sales_history"):
+        most_recent_date = ctx.nft_data["sales_history"][0]["date"]
         date_to_predict = datetime.strptime(most_recent_date, "%Y-%m-%d %H:%M:%S").strftime("%B, %Y")
     
-    # Define the NFT appraisal conversation
-    content_prompt = """You are an expert at conducting NFT appraisals, and your goal is to output the price in USD value of the NFT at this specific date, which is $$$$$$. You will be given pricing history and other metadata about the NFT and will have to extrapolate and analyze the trends from the data. Your response MUST be in JSON format starting with a single value of price in USD, followed by a detailed explanation of your reasoning.
-
-            The sample data that you will be given will be in this input format, although the values will be different. Use it to understand how the data is laid out and what each entry means. Your analysis and appraisal should be more nuanced, smart, and data-driven than the example. 
-            
-            Your entire response/output is going to consist of a single JSON object, and you will NOT wrap it within JSON md markers
-
-            In the JSON, the price of Ethereum (price_ethereum) was how much Ethereum was paid at the time and the price in USD (price_usd) is the price of that Ethereum at the time of the sale in USD. 
-
-            Example Input:
-            {
-                "name": "Art Blocks",
-                "token_id": "78000956",
-                "token_address": "0xa7d8d9ef8d8ce8992df33d8b8cf4aebabd5bd270",
-                "metadata": {
-                    "symbol": "BLOCKS",
-                    "rarity_rank": "None",
-                    "rarity_percentage": "None",
-                    "amount": "1"
-                },
-                "sales_history": [
-                    {
-                        "price_ethereum": 24.61,
-                        "price_usd": 61914.7812,
-                        "date": "2025-03-03 17:49:35"
-                    },
-                    {
-                        "price_ethereum": 85.0,
-                        "price_usd": 108403.25579,
-                        "date": "2022-12-13 19:04:11"
-                    },
-                    {
-                        "price_ethereum": 0.17,
-                        "price_usd": 422.72201,
-                        "date": "2021-06-11 09:21:07"
-                    }
-                ]
-            }
-
-            Example Output:
-            {
-                "price": 67240,
-                "explanation": "Based on the sales history, the price of the NFT has been increasing over time. The most recent sale was for 24.61 ETH, which is worth $61914.7812 at the time of the sale. The previous sale was for 85 ETH, which is worth $108403.25579 at the time of the sale. The first sale was for 0.17 ETH, which is worth $422.72201 at the time of the sale. Based on this data, I estimate that the price of the NFT is currently $67240. Additional context on the rarity would help improve the response and the price estimate, however, with the given data, this seems a reasonable estimate for this date."
-            }
-            
-            """
-    
+    # Define the NFT appraisal conversation. The instructions lead as a byte-identical
+    # system message so providers can serve that prefix from their prompt cache
     nft_appraisal_conversation = [
-        {
-            "role": "system",
-            "content": content_prompt.replace("$$$$$$", date_to_predict or "the current date", 1)
-        },
+        _INSTRUCTIONS_MESSAGE,
+        _date_message(date_to_predict or "the current date"),
         {
             "role": "user",
-            "content": f"Your entire response/output is going to consist of a single JSON object, and you will NOT wrap it within JSON md markers. Here is the sample data: {NFT_DATA}."
+            "content": _USER_MESSAGE_TEMPLATE.format(ctx.nft_data)
         }
     ]
     
@@ -745,46 +1043,46 @@ async def run_confidence_consensus(contract_address, token_id, date_to_predict=N
     print_colored("Using sample data for NFT appraisal", "cyan")
     
     # Display configuration summary
-    for model in settings.consensus_config.models:
-        print_colored(f"Model: {model.model_id} (max_tokens: {model.max_tokens})", "yellow")
-    
-    aggregator_model = settings.consensus_config.aggregator_config.model
-    print_colored(f"Aggregator: {aggregator_model.model_id} (max_tokens: {aggregator_model.max_tokens})", "yellow")
+    if logger.is_enabled_for(logging.DEBUG):
+        for model in settings.consensus_config.models:
+            logger.debug("Consensus model", model=model.model_id, max_tokens=model.max_tokens)
+        aggregator_model = settings.consensus_config.aggregator_config.model
+        logger.debug("Aggregator model", model=aggregator_model.model_id, max_tokens=aggregator_model.max_tokens)
     
+    final_consensus = None
     try:
-        # Step 1: Get initial model responses
-        print_colored("\nGetting initial model responses...", "magenta")
-        logger.info("Starting initial model response collection")
-        initial_responses = await send_initial_round(
-            provider=provider,
-            consensus_config=settings.consensus_config,
-            initial_conversation=nft_appraisal_conversation
-        )
-        
-        # Display individual responses
-        format_and_print_responses(initial_responses, "<INITIAL MODEL RESPONSES>")
-        logger.info("Initial responses collected", model_count=len(initial_responses))
-        
-        # Step 2: Select a challenge prompt
+        # Step 1: Select a challenge prompt
         challenge_prompt = random.choice(CHALLENGE_PROMPTS)
         print_colored(f"\nSelected challenge prompt: '{challenge_prompt}'", "blue")
         
-        # Step 3: Send challenge to all models, including their original responses
-        print_colored("\nSending challenge prompt to all models...", "magenta")
-        challenge_responses = await send_challenge_round(
+        # Steps 2-3: Get each model's initial response, then challenge it with its own
+        # original response; models proceed independently until aggregation, and the
+        # challenges are cancelled if the initial prices already agree
+        print_colored("\nGetting initial model responses and sending challenges...", "magenta")
+        logger.info("Starting initial and challenge response collection")
+        initial_responses, challenge_responses = await send_initial_and_challenge_rounds(
             provider=provider,
             consensus_config=settings.consensus_config,
             initial_conversation=nft_appraisal_conversation,
             challenge_prompt=challenge_prompt,
-            initial_responses=initial_responses
+            cv_threshold=CHALLENGE_CV_THRESHOLD
         )
+        logger.info("Initial responses collected", model_count=len(initial_responses))
+        
+        analysis = None
+        if challenge_responses is None:
+            # Every model held its answer
+            challenge_responses = initial_responses
+            analysis = _unchallenged_analysis(initial_responses)
         
-        # Display challenge responses
+        # Display individual responses
+        format_and_print_responses(initial_responses, "<INITIAL MODEL RESPONSES>")
         format_and_print_responses(challenge_responses, "<CHALLENGE RESPONSES>")
         
         # Step 4: Analyze how models respond to the challenge
-        print_colored("\nAnalyzing model responses to challenge...", "magenta")
-        analysis = await analyze_model_responses(initial_responses, challenge_responses)
+        if analysis is None:
+            print_colored("\nAnalyzing model responses to challenge...", "magenta")
+            analysis = await analyze_model_responses(initial_responses, challenge_responses)
         
         # Step 5: Perform weighted aggregation
         print_colored("\nPerforming weighted aggregation...", "magenta")
@@ -792,7 +1090,8 @@ async def run_confidence_consensus(contract_address, token_id, date_to_predict=N
             provider=provider,
             aggregator_config=settings.consensus_config.aggregator_config,
             model_responses=challenge_responses,
-            analysis=analysis
+            analysis=analysis,
+            ctx=ctx
         )
         
         # Display the final consensus result
@@ -800,7 +1099,8 @@ async def run_confidence_consensus(contract_address, token_id, date_to_predict=N
         print_colored("FINAL CONSENSUS RESULT".center(80), "green")
         print_colored("=" * 80 + "\n", "green")
         
-        print(final_consensus)
+        final_consensus_json = orjson.dumps(final_consensus, option=orjson.OPT_INDENT_2)
+        print(final_consensus_json.decode())
         
         print_colored("\n" + "=" * 80, "green")
         
@@ -808,12 +1108,10 @@ async def run_confidence_consensus(contract_address, token_id, date_to_predict=N
         results_dir = Path("results")
         results_dir.mkdir(exist_ok=True)
         
-        # Save the JSON result
+        # Save the JSON result on a worker thread so the response isn't held up by disk I/O
         results_file = results_dir / "confident_consensus_result.json"
-        with open(results_file, "w") as f:
-            f.write(final_consensus)
-        
-        print_colored(f"\nSaved consensus result to {results_file}", "green")
+        save = asyncio.get_running_loop().run_in_executor(None, results_file.write_bytes, final_consensus_json)
+        save.add_done_callback(partial(_report_saved_result, results_file))
         
         
     except Exception as e:
@@ -821,41 +1119,80 @@ async def run_confidence_consensus(contract_address, token_id, date_to_predict=N
         import traceback
         traceback.print_exc()
     finally:
-        # Close the provider's HTTP client
-        await provider.close()
+        # Close the provider's HTTP client if it was created for this run
+        if owns_provider:
+            await provider.close()
 
-    # Return the final consensus result as JSON
-    try:
-        return json.loads(final_consensus)
-    except:
+    # Return the final consensus result
+    if final_consensus is None:
         return {"error": "Failed to parse final consensus result"}
+    _CONSENSUS_CACHE[result_key] = final_consensus_json
+    if semantic_vector is not None:
+        semantic_cache_add(semantic_vector, final_consensus_json)
+    return final_consensus
+
+# Provider shared by every request the server handles, bound to the server's event loop
+openrouter_provider = None
+
+@app.before_serving
+async def create_provider():
+    global openrouter_provider
+    openrouter_provider = AsyncOpenRouterProvider(
+        api_key=os.environ.get("OPEN_ROUTER_API_KEY", ""),
+        base_url=Settings().open_router_base_url,
+        # Keep idle connections open between requests so appraisals skip the TCP+TLS handshake,
+        # and multiplex each round's concurrent calls over HTTP/2
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300),
+        http2=True
+    )
+
+@app.after_serving
+async def close_provider():
+    await openrouter_provider.close()
 
-# Add Flask route to handle API requests
+def _json_response(payload, status=200):
+    """Serialize with orjson rather than the stdlib encoder behind jsonify"""
+    return Response(orjson.dumps(payload), status=status, mimetype="application/json")
+
+# Add route to handle API requests
 @app.route('/confidence_appraise', methods=['GET'])
-def nft_appraisal():
+async def nft_appraisal():
     contract_address = request.args.get('contract_address')
     token_id = request.args.get('token_id')
+    force_refresh = request.args.get('force_refresh', '').lower() in ('1', 'true', 'yes')
     
     if not contract_address or not token_id:
-        return jsonify({"error": "Missing contract_address or token_id parameters"}), 400
+        return _json_response({"error": "Missing contract_address or token_id parameters"}, 400)
     
     try:
-        # Run the consensus process asynchronously
-        result = asyncio.run(run_confidence_consensus(
+        # Run the consensus process on the server's event loop
+        result = await run_confidence_consensus(
             contract_address=contract_address,
             token_id=token_id,
-        ))
-        return jsonify(result)
+            provider=openrouter_provider,
+            force_refresh=force_refresh,
+        )
+        return _json_response(result)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return _json_response({"error": str(e)}, 500)
 
-# Update the main function to run the Flask app
+# Update the main function to run the Quart app
 def main():
     # Set the port from environment variable or use default
+    # Upstream concurrency is tuned with CONSENSUS_MAX_INFLIGHT (whole process, default 8)
+    # and CONSENSUS_MAX_INFLIGHT_PER_MODEL (default 2)
     port = int(os.environ.get('PORT', 8082))
-    app.run(debug=True, host='0.0.0.0', port=port)
+    # Each worker is a separate process with its own caches, and one event loop already
+    # overlaps every request's model calls, so a single worker is the default
+    workers = os.environ.get('WEB_CONCURRENCY', '1')
+    
+    # Replace this process with Hypercorn, the ASGI server Quart is built on, rather than
+    # the reloading development server
+    os.execvp(
+        sys.executable,
+        [sys.executable, "-m", "hypercorn", "--workers", workers, "--bind", f"0.0.0.0:{port}",
+         f"{Path(__file__).with_suffix('')}:app"]
+    )
 
 if __name__ == "__main__":
-    # Import needed modules for statistics
-    import statistics
     main()
\ No newline at end of file
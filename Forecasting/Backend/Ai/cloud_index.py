@@ -1,14 +1,22 @@
 #!/usr/bin/env python3
 import asyncio
+import atexit
 import os
-import json
 import re
+import math
 import random
-import statistics
 from pathlib import Path
 import textwrap
+import threading
+import time
+import weakref
+from functools import lru_cache
 import aiohttp
-from flask import Flask, request, jsonify
+import httpx
+import numpy as np
+import orjson
+from cachetools import TTLCache
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 
 from flare_ai_consensus.router import AsyncOpenRouterProvider
@@ -26,36 +34,158 @@ CORS(app)  # Enable CORS for all routes
 
 load_dotenv()
 
+# Console progress and response dumps are presentation only; the API server leaves them
+# off unless NFT_APPRAISAL_VERBOSE=1, while the CLI turns them on (errors always print)
+_VERBOSE = os.environ.get("NFT_APPRAISAL_VERBOSE", "0") == "1"
+
+# Latest appraisal is written here; the directory is created once per process
+RESULTS_DIR = Path("results")
+RESULTS_DIR.mkdir(exist_ok=True)
+
+COINGECKO_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price"
+
+# Shared HTTP session for outbound API calls and the event loop it belongs to
+_HTTP_SESSION = None
+_HTTP_SESSION_LOOP = None
+
+# Shared OpenRouter provider, the event loop it belongs to, and a per-loop lock guarding its creation
+_PROVIDER = None
+_PROVIDER_LOOP = None
+_PROVIDER_LOCKS = weakref.WeakKeyDictionary()
+
+# Event loop that runs every API request's appraisal, on its own thread, so pooled
+# connections outlive individual requests
+_BACKGROUND_LOOP = None
+_BACKGROUND_LOOP_LOCK = threading.Lock()
+
+# Longest an API request waits for its appraisal, in seconds
+APPRAISAL_TIMEOUT = 300
+
+# Last ETH/USD price from CoinGecko, reused for _ETH_TTL seconds
+_ETH_PRICE_CACHE = {"price": None, "ts": 0.0}
+_ETH_TTL = 30.0
+# asyncio locks belong to one event loop, so each loop gets its own
+_ETH_PRICE_LOCKS = weakref.WeakKeyDictionary()
+
+# Appraisal results by "contract:token_id:date", reused for an hour without any model calls.
+# The ETH equivalent is recomputed on each hit from the current ETH price.
+_APPRAISAL_CACHE = TTLCache(maxsize=10_000, ttl=3600)
+
+# Keys a model may report its price under, in order of preference
+_PRICE_KEYS = ("price", "predicted_price", "predicted_price_USD")
+
+# Patterns for pulling prices out of model responses, compiled once
+_JSON_FENCE_RE = re.compile(r'```json\s*|\s*```')
+_PRICE_KEY_RE = re.compile(r'"(?:price|predicted_price|predicted_price_USD)"\s*:\s*([0-9,]+\.?[0-9]*)')
+_DOLLAR_RE = re.compile(r'\$([0-9,]+\.?[0-9]*)')
+
+# Below this many prices a pure-Python pass beats NumPy's per-call overhead
+_NUMPY_MIN_SAMPLES = 64
+
+# Improvement rounds stop once the models' prices agree within this coefficient of variation
+_EARLY_EXIT_CV = float(os.getenv("CONSENSUS_EARLY_EXIT_CV", "0.03"))
+
+
+# Appraisal instructions, identical for every request except for the date to appraise at,
+# which goes where "$$$$$$" is. Split once here so filling it in is a plain concatenation.
+_CONTENT_PROMPT = """You are an expert at conducting NFT appraisals, and your goal is to output the price in USD value of the NFT at this specific date, which is $$$$$$. You will be given pricing history and other metadata about the NFT and will have to extrapolate and analyze the trends from the data. Your response MUST be in JSON format starting with a single value of price in USD, followed by a detailed explanation of your reasoning.
+
+            The sample data that you will be given will be in this input format, although the values will be different. Use it to understand how the data is laid out and what each entry means. Your analysis and appraisal should be more nuanced, smart, and data-driven than the example. 
+            
+            Your entire response/output is going to consist of a single JSON object, and you will NOT wrap it within JSON md markers
+
+            In the JSON, the price of Ethereum (price_ethereum) was how much Ethereum was paid at the time and the price in USD (price_usd) is the price of that Ethereum at the time of the sale in USD. 
+
+            Example Input:
+            {
+                "name": "Art Blocks",
+                "token_id": "78000956",
+                "token_address": "0xa7d8d9ef8d8ce8992df33d8b8cf4aebabd5bd270",
+                "metadata": {
+                    "symbol": "BLOCKS",
+                    "rarity_rank": "None",
+                    "rarity_percentage": "None",
+                    "amount": "1"
+                },
+                "sales_history": [
+                    {
+                        "price_ethereum": 24.61,
+                        "price_usd": 61914.7812,
+                        "date": "2025-03-03 17:49:35"
+                    },
+                    {
+                        "price_ethereum": 85.0,
+                        "price_usd": 108403.25579,
+                        "date": "2022-12-13 19:04:11"
+                    },
+                    {
+                        "price_ethereum": 0.17,
+                        "price_usd": 422.72201,
+                        "date": "2021-06-11 09:21:07"
+                    }
+                ]
+            }
+
+            Example Output:
+            {
+                "price": 67240,
+                "explanation": "Based on the sales history, the price of the NFT has been increasing over time. The most recent sale was for 24.61 ETH, which is worth $61914.7812 at the time of the sale. The previous sale was for 85 ETH, which is worth $108403.25579 at the time of the sale. The first sale was for 0.17 ETH, which is worth $422.72201 at the time of the sale. Based on this data, I estimate that the price of the NFT is currently $67240. Additional context on the rarity would help improve the response and the price estimate, however, with the given data, this seems a reasonable estimate for this date."
+            }
+            
+            """
+_PROMPT_PREFIX, _PROMPT_SUFFIX = _CONTENT_PROMPT.split("$$$$$$", 1)
+
+# The user message wraps the NFT's JSON data between these
+_USER_PROMPT_PREFIX = "Your entire response/output is going to consist of a single JSON object, and you will NOT wrap it within JSON md markers. Here is the sample data: "
+_USER_PROMPT_SUFFIX = ". "
+
+
+@lru_cache(maxsize=1024)
+def _month_label(date):
+    """Format a "%Y-%m-%d %H:%M:%S" sale date as "Month, Year"."""
+    # fromisoformat parses this format much faster than strptime
+    return datetime.fromisoformat(date).strftime("%B, %Y")
+
 
 # Parse data to compare accuracy
 def accuracy_preparation(json_data):
-    if json_data["sales_history"]:
-        most_recent_transaction = json_data["sales_history"].pop(0)  # Removes and stores the first (latest) entry
-        formatted_date = datetime.strptime(most_recent_transaction["date"], "%Y-%m-%d %H:%M:%S").strftime("%B, %Y")
+    sales_history = json_data["sales_history"]
+    if sales_history:
+        # Hold out the first (latest) entry; the caller's dict and list are left untouched
+        most_recent_transaction = sales_history[0]
+        json_data = {**json_data, "sales_history": sales_history[1:]}
+        formatted_date = _month_label(most_recent_transaction["date"])
     
     return most_recent_transaction["price_usd"], formatted_date, json_data
 
 
+_COLORS = {
+    "red": "\033[91m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "blue": "\033[94m",
+    "magenta": "\033[95m",
+    "cyan": "\033[96m",
+    "reset": "\033[0m"
+}
+
+
 def print_colored(text, color=None):
     """Print text with ANSI color codes"""
-    colors = {
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "blue": "\033[94m",
-        "magenta": "\033[95m",
-        "cyan": "\033[96m",
-        "reset": "\033[0m"
-    }
-    
-    if color and color in colors:
-        print(f"{colors[color]}{text}{colors['reset']}")
+    if not _VERBOSE and color != "red":
+        return
+    
+    if color and color in _COLORS:
+        print(f"{_COLORS[color]}{text}{_COLORS['reset']}")
     else:
         print(text)
 
 
 def format_and_print_responses(responses, title="Model Responses"):
     """Format and print model responses nicely in the terminal"""
+    if not _VERBOSE:
+        return
+    
     terminal_width = 80
     separator = "=" * terminal_width
     
@@ -66,64 +196,119 @@ def format_and_print_responses(responses, title="Model Responses"):
     for model_id, response in responses.items():
         print_colored(f"Model: {model_id}", "yellow")
         
-        # Format and wrap the response text
-        wrapped_text = textwrap.fill(str(response), width=terminal_width-4)
-        indented_text = textwrap.indent(wrapped_text, "  ")
-        print(indented_text)
+        # Format and wrap the response text; short responses only need indenting
+        response_text = str(response)
+        if len(response_text) > terminal_width - 4 or "\n" in response_text:
+            response_text = textwrap.fill(response_text, width=terminal_width-4)
+        print(textwrap.indent(response_text, "  "))
         print_colored(f"{'-' * terminal_width}", "blue")
 
 
-def extract_price_from_text(text):
-    """Extract the price from a response text or JSON string"""
+def _extract_price_and_explanation(text):
+    """Extract the price and explanation from a response text or JSON string with a single JSON parse"""
+    if isinstance(text, dict):
+        for key in _PRICE_KEYS:
+            if key in text:
+                return float(text[key]), text.get("explanation")
     if not isinstance(text, str):
-        if isinstance(text, dict) and "price" in text:
-            return float(text["price"])
-        elif isinstance(text, dict) and "predicted_price" in text:
-            return float(text["predicted_price"])
         text = str(text)
-        
-    # First try to parse as JSON
+    
+    explanation = None
+    
+    # First try to parse as JSON, stripping code block markers if present
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        cleaned = cleaned.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
     try:
-        # Remove JSON code block markers if present
-        if text.strip().startswith("```json"):
-            text = re.sub(r'```json\s*|\s*```', '', text)
-        
-        # Try parsing the text as JSON
-        data = json.loads(text)
+        data = orjson.loads(cleaned)
         if isinstance(data, dict):
-            if "price" in data:
-                return float(data["price"])
-            elif "predicted_price" in data:
-                return float(data["predicted_price"])
-            elif "predicted_price_USD" in data:
-                return float(data["predicted_price_USD"])
-    except (json.JSONDecodeError, ValueError, TypeError):
+            explanation = data.get("explanation")
+            for key in _PRICE_KEYS:
+                if key in data:
+                    return float(data[key]), explanation
+    except (orjson.JSONDecodeError, ValueError, TypeError):
         pass
     
     # If JSON parsing fails, try regular expression pattern matching
     try:
         # Look for "price": 1234.56 or "predicted_price": 1234.56
-        price_match = re.search(r'"(?:price|predicted_price|predicted_price_USD)"\s*:\s*([0-9,]+\.?[0-9]*)', text)
+        price_match = _PRICE_KEY_RE.search(text)
         if price_match:
-            return float(price_match.group(1).replace(',', ''))
+            return float(price_match.group(1).replace(',', '')), explanation
         
         # Also try looking for dollar amounts
-        dollar_match = re.search(r'\$([0-9,]+\.?[0-9]*)', text)
+        dollar_match = _DOLLAR_RE.search(text)
         if dollar_match:
-            return float(dollar_match.group(1).replace(',', ''))
+            return float(dollar_match.group(1).replace(',', '')), explanation
     except (ValueError, AttributeError):
         pass
     
-    # Return None if no price was found
-    return None
+    # No price was found
+    return None, explanation
+
+
+def extract_price_from_text(text):
+    """Extract the price from a response text or JSON string"""
+    return _extract_price_and_explanation(text)[0]
+
+
+def _mean_stdev(values):
+    """Mean and sample standard deviation in a single pass (Welford's algorithm, or NumPy for many values)"""
+    if len(values) >= _NUMPY_MIN_SAMPLES:
+        arr = np.fromiter(values, dtype=np.float64, count=len(values))
+        return float(arr.mean()), float(arr.std(ddof=1))
+    
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in values:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return mean, math.sqrt(m2 / (n - 1)) if n > 1 else 0.0
 
 
-def calculate_confidence(std_dev, prices):
+def _summarize_responses(responses, label=None):
+    """
+    Extract every model's price and explanation in one pass over the responses.
+    
+    Returns:
+        tuple: ({model_id: price}, [explanations], mean price, price standard deviation)
+    """
+    prices = {}
+    explanations = []
+    for model_id, response in responses.items():
+        if not response:
+            continue
+        price, explanation = _extract_price_and_explanation(response)
+        if price is not None:
+            prices[model_id] = price
+            if label:
+                print_colored(f"Extracted {label} from {model_id}: ${price:.2f}", "green")
+        if explanation:
+            explanations.append(explanation)
+    
+    mean_price, std_dev = _mean_stdev(prices.values())
+    return prices, explanations, mean_price, std_dev
+
+
+def _converged(responses):
+    """Whether further improvement rounds could not materially change these responses."""
+    prices, _, mean_price, std_dev = _summarize_responses(responses)
+    if len(prices) < 2:
+        # Agreement needs at least two prices to compare
+        return False
+    return mean_price > 0 and std_dev / mean_price < _EARLY_EXIT_CV
+
+
+def calculate_confidence(std_dev, prices, mean_price=None):
     """Calculate a confidence score based on standard deviation relative to mean"""
     if not prices or len(prices) < 2:
         return 0.5  # Default confidence with insufficient data
     
-    mean_price = statistics.mean(prices)
+    if mean_price is None:
+        mean_price = _mean_stdev(prices)[0]
     if mean_price == 0:
         return 0.5  # Avoid division by zero
     
@@ -185,41 +370,30 @@ async def run_consensus_with_data(
         # Handle the case where the aggregator fails to return a proper response
         print_colored("Error in aggregation: Empty response from aggregator model", "red")
         # Create a fallback aggregated response by combining the most common elements
-        prices = []
-        explanations = []
-        for model_id, response in responses.items():
-            price = extract_price_from_text(response)
-            if price is not None:
-                prices.append(price)
-            
-            # Try to extract explanation
-            try:
-                if isinstance(response, str) and response.strip().startswith("```json"):
-                    cleaned = re.sub(r'```json\s*|\s*```', '', response)
-                    data = json.loads(cleaned)
-                    if "explanation" in data:
-                        explanations.append(data["explanation"])
-            except:
-                pass
-        
-        # Calculate average price if any prices were found
-        avg_price = statistics.mean(prices) if prices else 0
+        prices, explanations, avg_price, _ = _summarize_responses(responses)
+        
+        # Use the average price if any prices were found
+        if not prices:
+            avg_price = 0
         
         # Use the first explanation or a default one
         explanation = explanations[0] if explanations else "Unable to generate explanation due to aggregation error."
         
         # Create a simple JSON response
-        aggregated_response = json.dumps({
+        aggregated_response = orjson.dumps({
             "price": avg_price,
             "explanation": explanation
-        })
+        }).decode()
         print_colored(f"Created fallback aggregation with price: ${avg_price:.2f}", "yellow")
 
     response_data["iteration_0"] = responses
     response_data["aggregate_0"] = aggregated_response
 
-    # Step 2: Improvement rounds
+    # Step 2: Improvement rounds, skipped once the models already agree
     for i in range(consensus_config.iterations):
+        if _converged(responses):
+            print_colored(f"Models converged, skipping remaining {consensus_config.iterations - i} round(s)", "blue")
+            break
         print_colored(f"Running improvement round {i+1}...", "blue")
         responses = await send_round(
             provider, consensus_config, initial_conversation, aggregated_response
@@ -260,34 +434,200 @@ async def fetch_nft_data(contract_address: str, token_id: str):
     # Now import using relative path
     from Backend.Ai.Sideinfo_api.sideinfo import main
     
-    # Call the main function directly
-    return main(contract_address, token_id)
+    # The Sideinfo client is synchronous; run it on a worker thread so other
+    # coroutines, such as the ETH price request, make progress meanwhile
+    return await asyncio.to_thread(main, contract_address, token_id)
+
+
+async def _get_session():
+    """
+    Return the shared aiohttp session, creating it on first use.
+    
+    Keeping one session keeps its connections alive between calls, so repeat requests
+    skip the TCP+TLS handshake. A session is tied to the event loop it was created on,
+    so a new one is created if the running loop has changed.
+    """
+    global _HTTP_SESSION, _HTTP_SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed or _HTTP_SESSION_LOOP is not loop:
+        _HTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+        _HTTP_SESSION_LOOP = loop
+    return _HTTP_SESSION
+
+
+async def close_http_session():
+    """Close the shared aiohttp session if one is open on the running loop"""
+    global _HTTP_SESSION, _HTTP_SESSION_LOOP
+    if _HTTP_SESSION is not None and _HTTP_SESSION_LOOP is asyncio.get_running_loop():
+        await _HTTP_SESSION.close()
+    _HTTP_SESSION = None
+    _HTTP_SESSION_LOOP = None
+
+
+async def _get_provider(api_key, base_url, model_count):
+    """
+    Return the shared OpenRouter provider, creating it on first use on the running loop.
+    
+    The provider's connection pool is sized to the model fan-out, so every concurrent call
+    in a round has a kept-alive connection, with a timeout that allows for long generations.
+    Like the aiohttp session it is tied to its event loop and recreated if the loop changes.
+    """
+    global _PROVIDER, _PROVIDER_LOOP
+    loop = asyncio.get_running_loop()
+    if _PROVIDER is not None and _PROVIDER_LOOP is loop:
+        return _PROVIDER
+    
+    lock = _PROVIDER_LOCKS.get(loop)
+    if lock is None:
+        lock = _PROVIDER_LOCKS[loop] = asyncio.Lock()
+    
+    async with lock:
+        if _PROVIDER is None or _PROVIDER_LOOP is not loop:
+            provider = AsyncOpenRouterProvider(
+                api_key=api_key,
+                base_url=base_url,
+                limits=httpx.Limits(
+                    max_connections=max(64, model_count * 4),
+                    max_keepalive_connections=64,
+                    keepalive_expiry=75
+                ),
+                http2=True,
+                timeout=httpx.Timeout(600.0, connect=10.0)
+            )
+            # Patch the provider for better logging
+            _PROVIDER = await patch_provider_for_logging(provider)
+            _PROVIDER_LOOP = loop
+    return _PROVIDER
+
+
+async def close_provider():
+    """Close the shared provider if one is open on the running loop"""
+    global _PROVIDER, _PROVIDER_LOOP
+    if _PROVIDER is not None and _PROVIDER_LOOP is asyncio.get_running_loop():
+        await _PROVIDER.close()
+    _PROVIDER = None
+    _PROVIDER_LOOP = None
+
+
+async def _close_shared_clients():
+    """Close the shared provider and HTTP session on the running loop"""
+    try:
+        await close_provider()
+    finally:
+        await close_http_session()
+
+
+def _cached_ethereum_price():
+    """Return the cached ETH price if it is still fresh, otherwise None"""
+    if _ETH_PRICE_CACHE["price"] is not None and time.monotonic() - _ETH_PRICE_CACHE["ts"] < _ETH_TTL:
+        return _ETH_PRICE_CACHE["price"]
+    return None
 
 
 async def fetch_ethereum_price():
-    """Fetch current Ethereum price in USD from CoinGecko API"""
-    url = "https://api.coingecko.com/api/v3/simple/price"
-    params = {
-        "ids": "ethereum",
-        "vs_currencies": "usd"
-    }
-    
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, params=params) as response:
+    """Fetch current Ethereum price in USD from CoinGecko API, cached for _ETH_TTL seconds"""
+    price = _cached_ethereum_price()
+    if price is not None:
+        return price
+    
+    loop = asyncio.get_running_loop()
+    lock = _ETH_PRICE_LOCKS.get(loop)
+    if lock is None:
+        lock = _ETH_PRICE_LOCKS[loop] = asyncio.Lock()
+    
+    # Concurrent misses wait for the first request instead of each calling CoinGecko
+    async with lock:
+        price = _cached_ethereum_price()
+        if price is not None:
+            return price
+        
+        params = {
+            "ids": "ethereum",
+            "vs_currencies": "usd"
+        }
+        
+        session = await _get_session()
+        async with session.get(COINGECKO_PRICE_URL, params=params) as response:
             if response.status != 200:
                 raise Exception(f"CoinGecko API request failed with status {response.status}")
             data = await response.json()
-            return data["ethereum"]["usd"]
+            price = data["ethereum"]["usd"]
+        
+        _ETH_PRICE_CACHE["price"] = price
+        _ETH_PRICE_CACHE["ts"] = time.monotonic()
+        return price
+
+
+async def _ethereum_equivalent(price_usd, eth_price_task):
+    """Convert a USD price to ETH using the awaited ETH price, or 0 if it is unavailable"""
+    try:
+        eth_price = await eth_price_task
+    except Exception as e:
+        print_colored(f"Warning: Could not fetch ETH price: {e}", "yellow")
+        eth_price = 0
+    return price_usd / eth_price if eth_price > 0 else 0
+
+
+def _get_background_loop():
+    """Return the shared appraisal event loop, starting its thread on first use"""
+    global _BACKGROUND_LOOP
+    with _BACKGROUND_LOOP_LOCK:
+        if _BACKGROUND_LOOP is None:
+            _BACKGROUND_LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_BACKGROUND_LOOP.run_forever, name="appraisal-loop", daemon=True).start()
+            atexit.register(_stop_background_loop)
+        return _BACKGROUND_LOOP
+
+
+def _stop_background_loop():
+    """Close the shared provider and session on the background loop, then stop the loop"""
+    try:
+        asyncio.run_coroutine_threadsafe(_close_shared_clients(), _BACKGROUND_LOOP).result(timeout=5)
+    finally:
+        _BACKGROUND_LOOP.call_soon_threadsafe(_BACKGROUND_LOOP.stop)
+
+
+async def _appraise_and_close_session(contract_address: str, token_id: str):
+    """Run one appraisal on a fresh event loop and release the shared clients before it closes"""
+    try:
+        return await process_nft_appraisal(contract_address, token_id)
+    finally:
+        await _close_shared_clients()
+
+
+@lru_cache(maxsize=4)
+def _load_settings(config_file, mtime):
+    """Build settings with the consensus configuration; mtime is part of the cache key so edits invalidate it"""
+    settings = Settings()
+    config_json = load_json(Path(config_file))
+    settings.load_consensus_config(config_json)
+    return settings
 
 
 async def process_nft_appraisal(contract_address: str, token_id: str):
     """Main processing function for NFT appraisal"""
     print_colored("Fetching NFT data...", "blue")
     
+    # The ETH price is only needed for the final output, so fetch it alongside everything else.
+    # Retrieving its exception on completion keeps an early return from logging an unawaited error
+    eth_price_task = asyncio.create_task(fetch_ethereum_price())
+    eth_price_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+    
     # Fetch NFT data
     metadata_data = await fetch_nft_data(contract_address, token_id)
     ACTUAL_VALUE, DATE_TO_PREDICT, metadata_data = accuracy_preparation(metadata_data)
     
+    # Serve a recent appraisal of the same NFT and date, with a fresh ETH conversion
+    cache_key = f"{contract_address.lower()}:{token_id}:{DATE_TO_PREDICT}"
+    cached = _APPRAISAL_CACHE.get(cache_key)
+    if cached is not None:
+        print_colored(f"Returning cached appraisal for {contract_address}/{token_id}", "green")
+        final_output = dict(cached)
+        final_output["ethereum_price_usd"] = await _ethereum_equivalent(final_output["price"], eth_price_task)
+        return orjson.dumps(final_output, option=orjson.OPT_INDENT_2).decode()
     
     print_colored("Preparing models...", "blue")
     
@@ -298,85 +638,30 @@ async def process_nft_appraisal(contract_address: str, token_id: str):
         print("Please set your OpenRouter API key in your .env file")
         return None
 
-    # Initialize the settings
-    settings = Settings()
-    
     # Create paths for configuration and data
     config_path = Path("config")
     config_path.mkdir(exist_ok=True)
     
     # Load or create the consensus configuration
     config_file = config_path / "consensus_config.json"
-
     
-    # Load the configuration
-    config_json = load_json(config_file)
-    settings.load_consensus_config(config_json)
+    # Load the configuration, re-reading the file only when it has been edited
+    settings = _load_settings(str(config_file), config_file.stat().st_mtime)
     
-    # Create the OpenRouter provider
-    provider = AsyncOpenRouterProvider(
-        api_key=api_key,
-        base_url=settings.open_router_base_url
+    # Reuse the process-wide provider so its connections stay warm between appraisals
+    provider = await _get_provider(
+        api_key, settings.open_router_base_url, len(settings.consensus_config.models)
     )
     
-    # Patch the provider for better logging
-    provider = await patch_provider_for_logging(provider)
-    
-    content_prompt = """You are an expert at conducting NFT appraisals, and your goal is to output the price in USD value of the NFT at this specific date, which is $$$$$$. You will be given pricing history and other metadata about the NFT and will have to extrapolate and analyze the trends from the data. Your response MUST be in JSON format starting with a single value of price in USD, followed by a detailed explanation of your reasoning.
-
-            The sample data that you will be given will be in this input format, although the values will be different. Use it to understand how the data is laid out and what each entry means. Your analysis and appraisal should be more nuanced, smart, and data-driven than the example. 
-            
-            Your entire response/output is going to consist of a single JSON object, and you will NOT wrap it within JSON md markers
-
-            In the JSON, the price of Ethereum (price_ethereum) was how much Ethereum was paid at the time and the price in USD (price_usd) is the price of that Ethereum at the time of the sale in USD. 
-
-            Example Input:
-            {
-                "name": "Art Blocks",
-                "token_id": "78000956",
-                "token_address": "0xa7d8d9ef8d8ce8992df33d8b8cf4aebabd5bd270",
-                "metadata": {
-                    "symbol": "BLOCKS",
-                    "rarity_rank": "None",
-                    "rarity_percentage": "None",
-                    "amount": "1"
-                },
-                "sales_history": [
-                    {
-                        "price_ethereum": 24.61,
-                        "price_usd": 61914.7812,
-                        "date": "2025-03-03 17:49:35"
-                    },
-                    {
-                        "price_ethereum": 85.0,
-                        "price_usd": 108403.25579,
-                        "date": "2022-12-13 19:04:11"
-                    },
-                    {
-                        "price_ethereum": 0.17,
-                        "price_usd": 422.72201,
-                        "date": "2021-06-11 09:21:07"
-                    }
-                ]
-            }
-
-            Example Output:
-            {
-                "price": 67240,
-                "explanation": "Based on the sales history, the price of the NFT has been increasing over time. The most recent sale was for 24.61 ETH, which is worth $61914.7812 at the time of the sale. The previous sale was for 85 ETH, which is worth $108403.25579 at the time of the sale. The first sale was for 0.17 ETH, which is worth $422.72201 at the time of the sale. Based on this data, I estimate that the price of the NFT is currently $67240. Additional context on the rarity would help improve the response and the price estimate, however, with the given data, this seems a reasonable estimate for this date."
-            }
-            
-            """
-    
     # Define the NFT appraisal conversation
     nft_appraisal_conversation = [
         {
             "role": "system",
-            "content": content_prompt.replace("$$$$$$", DATE_TO_PREDICT, 1)
+            "content": f"{_PROMPT_PREFIX}{DATE_TO_PREDICT}{_PROMPT_SUFFIX}"
             },
         {
             "role": "user",
-            "content": f"Your entire response/output is going to consist of a single JSON object, and you will NOT wrap it within JSON md markers. Here is the sample data: {metadata_data}. "
+            "content": f"{_USER_PROMPT_PREFIX}{orjson.dumps(metadata_data).decode()}{_USER_PROMPT_SUFFIX}"
         }
     ]
     
@@ -405,23 +690,12 @@ async def process_nft_appraisal(contract_address: str, token_id: str):
         # Display individual responses
         format_and_print_responses(individual_responses, "<INDIVIDUAL MODEL RESPONSES>")
         
-        # Extract price estimates from individual responses
-        initial_prices = {}
-        for model_id, response in individual_responses.items():
-            price = extract_price_from_text(response)
-            if price is not None:
-                initial_prices[model_id] = price
-                print_colored(f"Extracted price from {model_id}: ${price:.2f}", "green")
+        # Extract price estimates from individual responses, with their statistics
+        initial_prices, _, initial_mean_price, initial_std_dev = _summarize_responses(individual_responses, "price")
         
         # Calculate initial price statistics
-        initial_price_values = list(initial_prices.values())
-        if initial_price_values:
-            initial_mean_price = statistics.mean(initial_price_values)
-            if len(initial_price_values) > 1:
-                initial_std_dev = statistics.stdev(initial_price_values)
-            else:
-                initial_std_dev = 0
-            initial_confidence_score = calculate_confidence(initial_std_dev, initial_price_values)
+        if initial_prices:
+            initial_confidence_score = calculate_confidence(initial_std_dev, initial_prices, initial_mean_price)
             
             print_colored(f"Initial Price statistics:", "magenta")
             print_colored(f"- Mean price: ${initial_mean_price:.2f}", "cyan")
@@ -439,9 +713,9 @@ async def process_nft_appraisal(contract_address: str, token_id: str):
         print_colored("=" * 80 + "\n", "green")
         
         # Format and wrap the consensus text
-        wrapped_text = textwrap.fill(consensus_result, width=76)
-        indented_text = textwrap.indent(wrapped_text, "  ")
-        print(indented_text)
+        if _VERBOSE:
+            wrapped_text = textwrap.fill(consensus_result, width=76)
+            print(textwrap.indent(wrapped_text, "  "))
         
         print_colored("\n" + "=" * 80, "green")
         
@@ -449,7 +723,10 @@ async def process_nft_appraisal(contract_address: str, token_id: str):
         final_consensus_price = extract_price_from_text(consensus_result)
         
         # Get final model responses from the last iteration of consensus
+        # (improvement rounds may have stopped early, so take the last one that ran)
         final_iteration = settings.consensus_config.iterations
+        while final_iteration > 0 and f"iteration_{final_iteration}" not in all_responses_data:
+            final_iteration -= 1
         if final_iteration > 0 and f"iteration_{final_iteration}" in all_responses_data:
             final_responses = all_responses_data[f"iteration_{final_iteration}"]
             print_colored(f"\nUsing responses from iteration {final_iteration} for statistics", "magenta")
@@ -461,24 +738,12 @@ async def process_nft_appraisal(contract_address: str, token_id: str):
         if final_iteration > 0:
             format_and_print_responses(final_responses, "<FINAL MODEL RESPONSES>")
         
-        # Extract price estimates from final responses
-        final_prices = {}
-        for model_id, response in final_responses.items():
-            if response:  # Only process non-empty responses
-                price = extract_price_from_text(response)
-                if price is not None:
-                    final_prices[model_id] = price
-                    print_colored(f"Extracted final price from {model_id}: ${price:.2f}", "green")
+        # Extract price estimates from final responses (empty ones are skipped), with their statistics
+        final_prices, _, final_mean_price, final_std_dev = _summarize_responses(final_responses, "final price")
         
         # Calculate final price statistics
-        final_price_values = list(final_prices.values())
-        if final_price_values:
-            final_mean_price = statistics.mean(final_price_values)
-            if len(final_price_values) > 1:
-                final_std_dev = statistics.stdev(final_price_values)
-            else:
-                final_std_dev = 0
-            final_confidence_score = calculate_confidence(final_std_dev, final_price_values)
+        if final_prices:
+            final_confidence_score = calculate_confidence(final_std_dev, final_prices, final_mean_price)
             
             print_colored(f"Final Price statistics:", "magenta")
             print_colored(f"- Mean price: ${final_mean_price:.2f}", "cyan")
@@ -499,33 +764,26 @@ async def process_nft_appraisal(contract_address: str, token_id: str):
         # Clean up consensus result if it's a JSON string with JSON markdown
         cleaned_result = consensus_result
         if isinstance(consensus_result, str) and consensus_result.strip().startswith("```json"):
-            cleaned_result = re.sub(r'```json\s*|\s*```', '', consensus_result)
+            cleaned_result = _JSON_FENCE_RE.sub('', consensus_result)
         
         # Try to parse the result as JSON
         try:
-            result_json = json.loads(cleaned_result)
+            result_json = orjson.loads(cleaned_result)
             explanation = result_json.get("explanation", "")
             if not explanation and "predicted_price_USD" in result_json:
                 # Try alternative fields
                 explanation = result_json.get("text", "")
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             explanation = cleaned_result
             print_colored("Warning: Could not parse consensus result as JSON", "yellow")
         
-        # Before creating final output JSON, get ETH price
-        try:
-            eth_price = await fetch_ethereum_price()
-        except Exception as e:
-            print_colored(f"Warning: Could not fetch ETH price: {e}", "yellow")
-            eth_price = 0
-            
         # Create final output JSON
         final_output = {
             "price": final_consensus_price,
             "text": explanation,
             "standard_deviation": final_std_dev,
             "total_confidence": final_confidence_score,
-            "ethereum_price_usd":  final_consensus_price / eth_price if eth_price > 0 else 0,
+            "ethereum_price_usd": await _ethereum_equivalent(final_consensus_price, eth_price_task),
         }
         
         error_accuracy = abs(final_output["price"] - ACTUAL_VALUE) / ACTUAL_VALUE 
@@ -539,27 +797,31 @@ async def process_nft_appraisal(contract_address: str, token_id: str):
 
         final_output["models"] = {model_id: prediction for model_id, prediction in final_prices.items()}
         
-        print(f"Accuracy: {accuracy}")
-        print(f"Actual Value: {ACTUAL_VALUE}")
-        print(f"Predicted Value: {final_output['price']}")
+        if _VERBOSE:
+            print(f"Accuracy: {accuracy}")
+            print(f"Actual Value: {ACTUAL_VALUE}")
+            print(f"Predicted Value: {final_output['price']}")
         
-        # Convert to JSON string
-        final_json_string = json.dumps(final_output, indent=2)
+        # Convert to JSON
+        final_json_bytes = orjson.dumps(final_output, option=orjson.OPT_INDENT_2)
+        final_json_string = final_json_bytes.decode()
         
         # Print final JSON
         print_colored("\nFINAL JSON OUTPUT:", "magenta")
-        print(final_json_string)
-        
-        # Save the results to a file
-        results_dir = Path("results")
-        results_dir.mkdir(exist_ok=True)
+        if _VERBOSE:
+            print(final_json_string)
         
-        results_file = results_dir / "latest_consensus_result.json"
-        with open(results_file, "w") as f:
-            f.write(final_json_string)
+        # Save the results to a file. Writing a temporary file and renaming it over the
+        # result keeps readers and concurrent workers from ever seeing a partial write
+        results_file = RESULTS_DIR / "latest_consensus_result.json"
+        tmp_file = results_file.with_name(f".{results_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_bytes(final_json_bytes)
+        os.replace(tmp_file, results_file)
         
         print_colored(f"\nSaved consensus result to {results_file}", "green")
         
+        _APPRAISAL_CACHE[cache_key] = final_output
+        
         # Return the final JSON string
         return final_json_string
         
@@ -567,15 +829,12 @@ async def process_nft_appraisal(contract_address: str, token_id: str):
         print_colored(f"Error during consensus process: {e}", "red")
         import traceback
         traceback.print_exc()
-        return json.dumps({
+        return orjson.dumps({
             "price": 0,
             "text": f"Error during consensus process: {str(e)}",
             "standard_deviation": 0,
             "total_confidence": 0
-        })
-    finally:
-        # Close the provider's HTTP client
-        await provider.close()
+        }).decode()
 
 
 # Flask route for the API
@@ -596,14 +855,22 @@ def appraise_nft_api():
                 "total_confidence": 0
             }), 400
         
-        # Run the async processing in a new event loop
-        result_json = asyncio.run(process_nft_appraisal(contract_address, token_id))
+        # Run the appraisal on the shared background loop, where the HTTP session's
+        # connections stay open between requests
+        future = asyncio.run_coroutine_threadsafe(
+            process_nft_appraisal(contract_address, token_id), _get_background_loop()
+        )
+        try:
+            result_json = future.result(timeout=APPRAISAL_TIMEOUT)
+        except TimeoutError:
+            future.cancel()
+            raise
         
-        # Parse the result back to a dictionary
-        result = json.loads(result_json)
+        if result_json is None:
+            raise RuntimeError("Appraisal could not be run; check the server configuration")
         
-        # Return the result
-        return jsonify(result)
+        # The result is already serialized JSON, so return it as is
+        return Response(result_json, mimetype="application/json")
     
     except Exception as e:
         import traceback
@@ -621,18 +888,32 @@ if __name__ == "__main__":
     import sys
     
     # Check if running in API mode or CLI mode
-    if len(sys.argv) > 1 and sys.argv[1] == "--api":
+    if len(sys.argv) > 1 and sys.argv[1] in ("--api", "--dev"):
         # Run as API server
         port = int(sys.argv[2]) if len(sys.argv) > 2 else 8080
         print_colored(f"Starting API server on port {port}...", "green")
-        app.run(host='0.0.0.0', port=8080)
+        if sys.argv[1] == "--dev":
+            # Werkzeug development server, for local debugging only
+            app.run(host='0.0.0.0', port=port)
+        else:
+            # Replace this process with gunicorn. A single worker keeps one background event
+            # loop, cache and connection pool; its threads wait on appraisals that run
+            # concurrently on that loop
+            os.execvp(
+                sys.executable,
+                [sys.executable, "-m", "gunicorn", "-w", "1", "-k", "gthread", "--threads", "64",
+                 "--pythonpath", os.path.dirname(os.path.abspath(__file__)),
+                 "-b", f"0.0.0.0:{port}", "cloud_index:app"]
+            )
     elif len(sys.argv) == 3:
-        # Run as CLI
+        # Run as CLI, with console output on unless explicitly disabled
+        _VERBOSE = os.environ.get("NFT_APPRAISAL_VERBOSE", "1") == "1"
         contract_address = sys.argv[1]
         token_id = sys.argv[2]
-        result = asyncio.run(process_nft_appraisal(contract_address, token_id))
+        result = asyncio.run(_appraise_and_close_session(contract_address, token_id))
         print_colored("\nProgram completed.", "green")
     else:
         print("Usage:")
         print("  python cloud_index.py <contract_address> <token_id>  # Run as CLI")
-        print("  python cloud_index.py --api [port]                  # Run as API server")
\ No newline at end of file
+        print("  python cloud_index.py --api [port]                  # Run as API server")
+        print("  python cloud_index.py --dev [port]                  # Run the development server")
\ No newline at end of file
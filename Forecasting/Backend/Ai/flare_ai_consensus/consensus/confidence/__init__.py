@@ -3,11 +3,15 @@ Confidence-based consensus package.
 """
 
 from .confidence_aggregator import async_weighted_llm_aggregator, select_challenge_prompts
+from .confidence_cache import SemanticResponseCache
 from .confidence_consensus import run_confident_consensus, send_round, send_challenge_round
 from .confidence_embeddings import (
     calculate_confidence_score, 
     extract_price_and_explanation, 
-    calculate_text_similarity
+    calculate_text_similarity,
+    calculate_text_similarities,
+    get_gemini_embedding,
+    get_normalized_embedding
 )
 from .confidence_prompts import CHALLENGE_PROMPTS
 
@@ -15,10 +19,14 @@ __all__ = [
     "async_weighted_llm_aggregator",
     "calculate_confidence_score",
     "calculate_text_similarity",
+    "calculate_text_similarities",
     "CHALLENGE_PROMPTS",
     "extract_price_and_explanation",
+    "get_gemini_embedding",
+    "get_normalized_embedding",
     "run_confident_consensus",
     "select_challenge_prompts",
+    "SemanticResponseCache",
     "send_challenge_round",
     "send_round",
 ]
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""Semantic cache of initial-round model responses."""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+import structlog
+
+from flare_ai_consensus.consensus.confidence.confidence_embeddings import get_gemini_embedding
+from flare_ai_consensus.settings import Message
+
+logger = structlog.get_logger(__name__)
+
+
+def conversation_cache_text(conversation: List[Message]) -> str:
+    """
+    Build the text a conversation is cached under.
+
+    Args:
+        conversation: The input user prompt with system instructions
+
+    Returns:
+        str: The conversation's user messages, one per line
+    """
+    return "\n".join(message["content"] for message in conversation if message["role"] == "user")
+
+
+class SemanticResponseCache:
+    """
+    Initial-round responses, keyed by the embedding of the conversation that produced them.
+
+    A lookup hits when a stored conversation's cosine similarity to the new one is at least
+    the threshold. Similarity is only meaningful for Gemini embeddings, so without them a
+    lookup only hits on identical text. Safe to share between threads; embeddings are
+    computed outside the lock.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 256):
+        """
+        Args:
+            threshold: Minimum cosine similarity for a stored conversation to be reused
+            max_entries: Number of conversations kept, oldest evicted first
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        # text -> (Gemini unit embedding or None, {model_id: response})
+        self._entries: OrderedDict[str, tuple[Optional[np.ndarray], Dict[str, str]]] = OrderedDict()
+        # Stacked embeddings of the entries, rebuilt after the entries change
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_texts: List[str] = []
+        # Guards the entries and the matrix
+        self._lock = threading.Lock()
+
+    def lookup(self, text: str, model_ids: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Find stored responses from every given model for a conversation like this one.
+
+        Args:
+            text: Cache text of the new conversation
+            model_ids: Models whose responses are needed
+
+        Returns:
+            dict: {model_id: response} for the given models, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(text)
+            has_entries = bool(self._entries)
+        if entry is None and has_entries:
+            query = get_gemini_embedding(text)
+            if query is not None:
+                with self._lock:
+                    matrix = self._embedding_matrix()
+                    if matrix is not None:
+                        similarities = matrix @ query
+                        best = int(np.argmax(similarities))
+                        if similarities[best] >= self.threshold:
+                            entry = self._entries[self._matrix_texts[best]]
+                            logger.info("Semantic cache hit", similarity=float(similarities[best]))
+
+        if entry is None:
+            return None
+        responses = entry[1]
+        if not all(model_id in responses for model_id in model_ids):
+            return None
+        return {model_id: responses[model_id] for model_id in model_ids}
+
+    def store(self, text: str, responses: Dict[str, str]) -> None:
+        """
+        Store a conversation's initial-round responses.
+
+        Args:
+            text: Cache text of the conversation
+            responses: {model_id: response} from the initial round
+        """
+        embedding = get_gemini_embedding(text)
+        with self._lock:
+            self._entries.pop(text, None)
+            self._entries[text] = (embedding, dict(responses))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._matrix = None
+
+    def _embedding_matrix(self) -> Optional[np.ndarray]:
+        """Stack the stored Gemini embeddings, one per row. Call with the lock held."""
+        if self._matrix is None:
+            self._matrix_texts = [
+                text for text, (embedding, _) in self._entries.items() if embedding is not None
+            ]
+            self._matrix = (
+                np.stack([self._entries[text][0] for text in self._matrix_texts])
+                if self._matrix_texts else None
+            )
+        return self._matrix
@@ -2,7 +2,7 @@
 
 import asyncio
 import random
-from typing import Dict, List, Tuple, Optional
+from typing import AsyncIterator, Awaitable, Dict, List, Tuple, Optional
 
 import structlog
 
@@ -14,6 +14,12 @@ from flare_ai_consensus.utils import parse_chat_response
 from flare_ai_consensus.consensus.confidence.confidence_aggregator import (
     async_weighted_llm_aggregator, select_challenge_prompts
 )
+from flare_ai_consensus.consensus.confidence.confidence_cache import (
+    SemanticResponseCache, conversation_cache_text
+)
+from flare_ai_consensus.consensus.confidence.confidence_embeddings import (
+    extract_price_and_explanation, calculate_text_similarity
+)
 from flare_ai_consensus.consensus.confidence.confidence_prompts import CHALLENGE_PROMPTS
 
 logger = structlog.get_logger(__name__)
@@ -24,7 +30,8 @@ async def run_confident_consensus(
     consensus_config: ConsensusConfig,
     initial_conversation: List[Message],
     num_challenges: int = 3,  # Number of challenge iterations
-    response_collector: Optional[Dict[str, Dict[str, str]]] = None
+    response_collector: Optional[Dict[str, Dict[str, str]]] = None,
+    response_cache: Optional[SemanticResponseCache] = None
 ) -> str:
     """
     Run the confidence-based consensus process with challenge rounds.
@@ -35,6 +42,7 @@ async def run_confident_consensus(
         initial_conversation: The input user prompt with system instructions
         num_challenges: Number of challenge rounds to run
         response_collector: Optional dictionary to collect all responses
+        response_cache: Optional cache of initial responses to similar conversations
         
     Returns:
         Final aggregated response
@@ -43,25 +51,36 @@ async def run_confident_consensus(
     all_model_responses = response_collector or {}
     
     # Step 1: Get initial responses from all models if not already provided
-    if not all(model_id in all_model_responses for model_id in [m.model_id for m in consensus_config.models]):
-        logger.info("Getting initial responses from models")
-        initial_responses = await send_round(
-            provider, consensus_config, initial_conversation
-        )
+    model_ids = [m.model_id for m in consensus_config.models]
+    if not all(model_id in all_model_responses for model_id in model_ids):
+        initial_responses = None
+        if response_cache is not None:
+            # Embedding may call out to the Gemini API, so keep it off the event loop
+            cache_text = conversation_cache_text(initial_conversation)
+            initial_responses = await asyncio.to_thread(response_cache.lookup, cache_text, model_ids)
+        
+        if initial_responses is not None:
+            logger.info("Reusing cached initial responses")
+        else:
+            logger.info("Getting initial responses from models")
+            initial_responses = await send_round(
+                provider, consensus_config, initial_conversation
+            )
+            if response_cache is not None:
+                await asyncio.to_thread(response_cache.store, cache_text, initial_responses)
         
         # Initialize the all_model_responses dictionary
         for model_id, response in initial_responses.items():
             all_model_responses[model_id] = {"initial": response}
     
-    # Step 2: Run challenge rounds
+    # Step 2: Run challenge rounds. Every challenge is chosen from the initial responses alone,
+    # so the rounds don't depend on each other and are all sent at once
+    initial_by_model = {model_id: responses["initial"] for model_id, responses in all_model_responses.items()}
+    round_challenges = []
     for i in range(num_challenges):
-        logger.info(f"Running challenge round {i+1}/{num_challenges}")
-        
         # Select challenge prompts for each model
-        challenges = await select_challenge_prompts(
-            provider, {model_id: responses["initial"] for model_id, responses in all_model_responses.items()}, 
-            num_challenges=1
-        )
+        challenges = await select_challenge_prompts(provider, initial_by_model, num_challenges=1)
+        round_challenges.append(challenges)
         
         # Log the selected challenges
         for model_id, challenge_list in challenges.items():
@@ -71,39 +90,36 @@ async def run_confident_consensus(
                 challenge_round=i+1,
                 challenge=challenge_list[0][:100] + "..." if len(challenge_list[0]) > 100 else challenge_list[0]
             )
+    
+    # Send challenges to models, analysing each response as soon as it arrives so the
+    # analysis overlaps with the models that are still answering
+    logger.info(f"Running {num_challenges} challenge rounds")
+    round_responses = [{} for _ in round_challenges]
+    async for i, model_id, response in _iter_challenge_responses(
+        provider, consensus_config, initial_conversation, round_challenges
+    ):
+        round_responses[i][model_id] = response
         
-        # Send challenges to models
-        challenge_responses = await send_challenge_round(
-            provider, 
-            consensus_config, 
-            initial_conversation,
-            challenges
+        # Log response changes; parsing and embedding block, so they run off the event loop
+        initial_price, current_price, similarity = await asyncio.to_thread(
+            _analyse_challenge_response, all_model_responses[model_id]["initial"], response
         )
         
+        logger.info(
+            "Challenge response analysis", 
+            model_id=model_id,
+            round=i+1,
+            initial_price=f"${initial_price:.2f}",
+            current_price=f"${current_price:.2f}",
+            similarity=f"{similarity:.4f}"
+        )
+    
+    for i, challenge_responses in enumerate(round_responses):
         # Store the response from this challenge round
         for model_id, response in challenge_responses.items():
             all_model_responses[model_id][f"challenge_{i+1}"] = response
             # Update the "final" response with the latest response
             all_model_responses[model_id]["final"] = response
-            
-            # Log response changes
-            initial_response = all_model_responses[model_id]["initial"]
-            from flare_ai_consensus.consensus.confidence.confidence_embeddings import (
-                extract_price_and_explanation, calculate_text_similarity
-            )
-            
-            initial_price, _ = extract_price_and_explanation(initial_response)
-            current_price, _ = extract_price_and_explanation(response)
-            similarity = calculate_text_similarity(initial_response, response)
-            
-            logger.info(
-                "Challenge response analysis", 
-                model_id=model_id,
-                round=i+1,
-                initial_price=f"${initial_price:.2f}",
-                current_price=f"${current_price:.2f}",
-                similarity=f"{similarity:.4f}"
-            )
     
     # Step 3: Create weighted aggregation based on confidence
     logger.info("Creating weighted aggregation based on confidence")
@@ -114,30 +130,6 @@ async def run_confident_consensus(
     return aggregated_response
 
 
-def _build_challenge_conversation(
-    initial_conversation: List[Message],
-    challenge_prompt: str,
-) -> List[Message]:
-    """
-    Build a conversation that includes a challenge prompt.
-    
-    Args:
-        initial_conversation: Original conversation
-        challenge_prompt: The challenge prompt to add
-        
-    Returns:
-        Updated conversation with challenge
-    """
-    conversation = initial_conversation.copy()
-    
-    # Add challenge prompt as user message
-    conversation.append(
-        {"role": "user", "content": challenge_prompt}
-    )
-    
-    return conversation
-
-
 async def _get_response_for_model_with_challenge(
     provider: AsyncOpenRouterProvider,
     model: ModelConfig,
@@ -156,21 +148,16 @@ async def _get_response_for_model_with_challenge(
     Returns:
         Tuple of (model_id, response)
     """
-    # Build conversation with challenge
-    conversation = _build_challenge_conversation(
-        initial_conversation, challenge_prompt
-    )
-    
     logger.info(
         "sending challenge prompt", 
         model_id=model.model_id,
         challenge=challenge_prompt[:100] + "..." if len(challenge_prompt) > 100 else challenge_prompt
     )
     
-    # Send request to model
+    # Send request to model, with the challenge appended as a user message in one list concatenation
     payload = ChatRequest(
         model=model.model_id,
-        messages=conversation,
+        messages=initial_conversation + [{"role": "user", "content": challenge_prompt}],
         max_tokens=model.max_tokens,
         temperature=model.temperature,
     )
@@ -206,6 +193,60 @@ async def send_challenge_round(
     Returns:
         Dictionary mapping model IDs to their responses
     """
+    tasks = _challenge_requests(provider, consensus_config, initial_conversation, model_challenges)
+    
+    # Run all tasks concurrently
+    results = await asyncio.gather(*tasks)
+    
+    # Convert results to dictionary
+    return dict(results)
+
+
+async def _iter_challenge_responses(
+    provider: AsyncOpenRouterProvider,
+    consensus_config: ConsensusConfig,
+    initial_conversation: List[Message],
+    round_challenges: List[Dict[str, List[str]]],
+) -> AsyncIterator[Tuple[int, str, str]]:
+    """
+    Send every round's challenges at once and yield the responses as they complete.
+    
+    Args:
+        provider: OpenRouter provider
+        consensus_config: Consensus configuration
+        initial_conversation: Original conversation
+        round_challenges: Model challenges for each round, as taken by send_challenge_round
+        
+    Yields:
+        Tuple of (round index, model_id, response), in completion order
+    """
+    async def with_round(i, request):
+        model_id, text = await request
+        return i, model_id, text
+    
+    requests = [
+        with_round(i, request)
+        for i, model_challenges in enumerate(round_challenges)
+        for request in _challenge_requests(provider, consensus_config, initial_conversation, model_challenges)
+    ]
+    for next_response in asyncio.as_completed(requests):
+        yield await next_response
+
+
+def _analyse_challenge_response(initial_response: str, response: str) -> Tuple[float, float, float]:
+    """Return (initial price, challenged price, similarity) for a model's challenge response."""
+    initial_price, _ = extract_price_and_explanation(initial_response)
+    current_price, _ = extract_price_and_explanation(response)
+    return initial_price, current_price, calculate_text_similarity(initial_response, response)
+
+
+def _challenge_requests(
+    provider: AsyncOpenRouterProvider,
+    consensus_config: ConsensusConfig,
+    initial_conversation: List[Message],
+    model_challenges: Dict[str, List[str]],
+) -> List[Awaitable[Tuple[str, str]]]:
+    """Create one challenge request per configured model, resolving to (model_id, response)."""
     tasks = []
     
     for model in consensus_config.models:
@@ -225,11 +266,7 @@ async def send_challenge_round(
         )
         tasks.append(task)
     
-    # Run all tasks concurrently
-    results = await asyncio.gather(*tasks)
-    
-    # Convert results to dictionary
-    return dict(results)
+    return tasks
 
 
 async def send_round(
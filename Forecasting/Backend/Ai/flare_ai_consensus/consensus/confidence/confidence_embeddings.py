@@ -5,6 +5,7 @@ import os
 import numpy as np
 from typing import Tuple
 import importlib.util
+from functools import lru_cache
 import structlog
 
 from dotenv import load_dotenv
@@ -26,6 +27,37 @@ except ImportError:
 
 logger = structlog.get_logger(__name__)
 
+def _fallback_embedding(text: str) -> np.ndarray:
+    """
+    Build a simplistic frequency-based vector for when Gemini can't embed a text.
+    
+    Its size is the number of unique words, so it isn't comparable to Gemini embeddings
+    or, in general, to the fallback vectors of other texts.
+    """
+    words = text.lower().split()
+    unique_words = list(set(words))
+    embedding = np.zeros(len(unique_words))
+    for i, word in enumerate(unique_words):
+        embedding[i] = words.count(word) / len(words)
+    return embedding
+
+
+def _gemini_embedding(text: str) -> np.ndarray:
+    """
+    Get embeddings for a text from Gemini's embedding model, raising if the call fails.
+    """
+    logger.info("Getting embeddings from Gemini API", text_length=len(text))
+    result = client.models.embed_content(
+        model="text-embedding-004",
+        contents=text
+    )
+    # Convert the ContentEmbedding object to a numpy array
+    # The values are stored in the 'values' field of the embedding
+    values = result.embeddings[0].values
+    logger.info("Received embeddings from Gemini API", embedding_size=len(values))
+    return np.array(values)
+
+
 def get_embeddings(text: str) -> np.ndarray:
     """
     Get embeddings for a text using Gemini's embedding model.
@@ -39,35 +71,15 @@ def get_embeddings(text: str) -> np.ndarray:
     if not gemini_available:
         logger.warning("Gemini API not available, using fallback embedding method")
         # Fallback to a simple approach if Gemini API is not available
-        # This creates a simplistic frequency-based vector
-        words = text.lower().split()
-        unique_words = list(set(words))
-        embedding = np.zeros(len(unique_words))
-        for i, word in enumerate(unique_words):
-            embedding[i] = words.count(word) / len(words)
-        return embedding
+        return _fallback_embedding(text)
     
     try:
         # Use Gemini's text embedding model
-        logger.info("Getting embeddings from Gemini API", text_length=len(text))
-        result = client.models.embed_content(
-            model="text-embedding-004",
-            contents=text
-        )
-        # Convert the ContentEmbedding object to a numpy array
-        # The values are stored in the 'values' field of the embedding
-        values = result.embeddings[0].values
-        logger.info("Received embeddings from Gemini API", embedding_size=len(values))
-        return np.array(values)
+        return _gemini_embedding(text)
     except Exception as e:
         logger.error("Error getting embeddings from Gemini API", error=str(e))
         # Fallback to simple approach
-        words = text.lower().split()
-        unique_words = list(set(words))
-        embedding = np.zeros(len(unique_words))
-        for i, word in enumerate(unique_words):
-            embedding[i] = words.count(word) / len(words)
-        return embedding
+        return _fallback_embedding(text)
 
 
 def extract_price_and_explanation(text: str) -> Tuple[float, str]:
@@ -153,6 +165,63 @@ def extract_price_and_explanation(text: str) -> Tuple[float, str]:
     return price, explanation
 
 
+def _unit_vector(embedding) -> np.ndarray:
+    """Return a read-only float32 copy of an embedding scaled to unit length (all zeros stay zero)."""
+    embedding = np.asarray(embedding, dtype=np.float32).ravel()
+    norm = np.linalg.norm(embedding)
+    if norm > 0:
+        embedding /= norm
+    # Cached arrays are shared between callers, so guard them against mutation
+    embedding.setflags(write=False)
+    return embedding
+
+
+@lru_cache(maxsize=512)
+def _cached_gemini_unit_embedding(text: str) -> np.ndarray:
+    """Unit-normalized Gemini embedding of a text. Failures raise, so lru_cache never stores them."""
+    return _unit_vector(_gemini_embedding(text))
+
+
+def get_gemini_embedding(text: str) -> np.ndarray | None:
+    """
+    Get the unit-normalized Gemini embedding for a text, computed once per distinct text.
+    
+    Args:
+        text: Text to embed
+        
+    Returns:
+        numpy.ndarray: Read-only float32 unit vector, or None if Gemini is unavailable or failed
+    """
+    if not gemini_available:
+        return None
+    try:
+        return _cached_gemini_unit_embedding(text)
+    except Exception as e:
+        logger.error("Error getting embeddings from Gemini API", error=str(e))
+        return None
+
+
+def get_normalized_embedding(text: str) -> np.ndarray:
+    """
+    Get the unit-normalized embedding for a text.
+    
+    Gemini embeddings are computed once per distinct text. The word-count fallback is
+    never cached, so a temporary Gemini error doesn't pin a degraded embedding to the text.
+    
+    Args:
+        text: Text to embed
+        
+    Returns:
+        numpy.ndarray: Read-only float32 unit vector (all zeros if the text has no embedding)
+    """
+    embedding = get_gemini_embedding(text)
+    if embedding is None:
+        if not gemini_available:
+            logger.warning("Gemini API not available, using fallback embedding method")
+        embedding = _unit_vector(_fallback_embedding(text))
+    return embedding
+
+
 def calculate_text_similarity(text1: str, text2: str) -> float:
     """
     Calculate the cosine similarity between two texts using Gemini embeddings.
@@ -166,44 +235,56 @@ def calculate_text_similarity(text1: str, text2: str) -> float:
     """
     logger.info("Calculating text similarity", text1_length=len(text1), text2_length=len(text2))
     
-    # Get embeddings
-    embedding1 = get_embeddings(text1)
-    embedding2 = get_embeddings(text2)
-    
-    # Ensure embeddings are 1D arrays
-    if hasattr(embedding1, 'shape') and len(embedding1.shape) > 1:
-        embedding1 = embedding1.flatten()
-    if hasattr(embedding2, 'shape') and len(embedding2.shape) > 1:
-        embedding2 = embedding2.flatten()
+    # Get cached unit-length embeddings
+    embedding1 = get_normalized_embedding(text1)
+    embedding2 = get_normalized_embedding(text2)
     
     # Ensure dimensions match for fallback method
-    if hasattr(embedding1, 'shape') and hasattr(embedding2, 'shape') and embedding1.shape != embedding2.shape:
+    if embedding1.shape != embedding2.shape:
         logger.warning("Embedding dimensions don't match", 
                       dim1=embedding1.shape, dim2=embedding2.shape)
         min_dim = min(embedding1.shape[0], embedding2.shape[0])
         embedding1 = embedding1[:min_dim]
         embedding2 = embedding2[:min_dim]
-    
-    # Calculate cosine similarity
-    try:
-        dot_product = np.dot(embedding1, embedding2)
         norm1 = np.linalg.norm(embedding1)
         norm2 = np.linalg.norm(embedding2)
-        
         if norm1 == 0 or norm2 == 0:
             logger.warning("Zero norm in embeddings", norm1=norm1, norm2=norm2)
             return 0.0
+        similarity = np.dot(embedding1, embedding2) / (norm1 * norm2)
+    else:
+        # Both vectors are already unit length, so the dot product is the cosine similarity
+        similarity = np.dot(embedding1, embedding2)
+    
+    # Ensure value is in [0, 1] range
+    similarity_value = max(0.0, min(float(similarity), 1.0))
+    logger.info("Calculated similarity", similarity=similarity_value)
+    return similarity_value
+
+
+def calculate_text_similarities(pairs: list[tuple[str, str]]) -> list[float]:
+    """
+    Calculate the cosine similarity of many text pairs in one vectorized pass.
+    
+    Args:
+        pairs: (first text, second text) tuples
         
-        similarity = dot_product / (norm1 * norm2)
-        
-        # Ensure value is in [0, 1] range
-        similarity_value = max(0.0, min(float(similarity), 1.0))
-        logger.info("Calculated similarity", similarity=similarity_value)
-        return similarity_value
-    except TypeError as e:
-        logger.error("Error calculating similarity", error=str(e))
-        # If vectors can't be compared, return 0.5 as a neutral similarity
-        return 0.5
+    Returns:
+        list[float]: Cosine similarity score (0-1) for each pair, in order
+    """
+    if not pairs:
+        return []
+    
+    firsts = [get_normalized_embedding(text1) for text1, _ in pairs]
+    seconds = [get_normalized_embedding(text2) for _, text2 in pairs]
+    
+    # Mixed dimensions only happen with the fallback embeddings, which need per-pair truncation
+    if len({e.shape for e in firsts + seconds}) > 1:
+        return [calculate_text_similarity(text1, text2) for text1, text2 in pairs]
+    
+    # Row-wise dot products of stacked unit vectors give every cosine similarity at once
+    similarities = np.einsum("ij,ij->i", np.stack(firsts), np.stack(seconds))
+    return np.clip(similarities, 0.0, 1.0).astype(float).tolist()
 
 
 def calculate_confidence_score(initial_response: str, final_response: str) -> float:
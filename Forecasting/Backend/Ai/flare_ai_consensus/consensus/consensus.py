@@ -181,16 +181,16 @@ async def process_prediction_market(self, question, iterations=2):
     """
     # Initialize components
     query_processor = QueryProcessor()
-    data_fetcher = FTSODataFetcher()
     verification_module = VerificationModule()
     
     # Process the query
     processed_query = query_processor.process_query(question)
     
-    # Fetch relevant FTSO data
+    # Fetch relevant FTSO data, closing the fetcher's RPC session afterwards
     feed_data = []
     if processed_query["required_feeds"]:
-        feed_data = await data_fetcher.fetch_multiple_feeds(processed_query["required_feeds"])
+        async with FTSODataFetcher() as data_fetcher:
+            feed_data = await data_fetcher.fetch_multiple_feeds(processed_query["required_feeds"])
     
     # Format data for the prompt
     data_summary = self._format_feed_data(feed_data)
@@ -285,11 +285,15 @@ async def process_prediction_market(self, question, iterations=2):
         all_responses, aggregated_response
     )
     
-    # Combine everything into the final result
+    # Combine everything into the final result, with feed IDs in their hex form so it
+    # stays JSON-serializable
     final_result = {
         "question": question,
-        "processed_query": processed_query,
-        "data_used": feed_data,
+        "processed_query": {
+            **processed_query,
+            "required_feeds": [_feed_id_hex(feed_id) for feed_id in processed_query["required_feeds"]]
+        },
+        "data_used": [{**feed, "feed_id": _feed_id_hex(feed["feed_id"])} for feed in feed_data],
         "final_decision": verification_module.extract_decision(aggregated_response),
         "confidence": verification_module.extract_confidence(aggregated_response),
         "reasoning": aggregated_response,
@@ -299,6 +303,11 @@ async def process_prediction_market(self, question, iterations=2):
     return final_result
 
 
+def _feed_id_hex(feed_id):
+    """Return a feed ID as a 0x-prefixed hex string, accepting raw bytes or hex."""
+    return "0x" + feed_id.hex() if isinstance(feed_id, bytes) else feed_id
+
+
 def _format_feed_data(self, feed_data):
     """Format FTSO feed data for inclusion in prompts."""
     if not feed_data:
@@ -309,8 +318,10 @@ def _format_feed_data(self, feed_data):
         # Handle decimal conversion appropriately
         value = feed["value"] / (10 ** abs(feed["decimals"]))
         feed_id = feed["feed_id"]
-        # Convert feed_id bytes to string representation
-        readable_id = bytes.fromhex(feed_id[2:].replace("0", "")).decode('utf-8', errors='ignore')
+        if isinstance(feed_id, str):
+            feed_id = bytes.fromhex(feed_id[2:])
+        # Feed IDs are a category byte followed by the zero-padded feed name
+        readable_id = feed_id[1:].rstrip(b"\x00").decode('utf-8', errors='ignore')
         formatted_data += f"- {readable_id}: ${value:.6f} (as of {datetime.fromtimestamp(feed['timestamp']).strftime('%Y-%m-%d %H:%M:%S')})\n"
     
     return formatted_data
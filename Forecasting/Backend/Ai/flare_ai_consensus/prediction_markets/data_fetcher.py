@@ -1,23 +1,96 @@
 # data_fetcher.py
 import json
 from datetime import datetime
-from web3 import Web3, HTTPProvider
+from web3 import AsyncWeb3, AsyncHTTPProvider
 import aiohttp
 import asyncio
+import threading
+import weakref
+from contextlib import AsyncExitStack
+from cachetools import TTLCache
+
+# Feeds by (network, feed_id). FTSO values only change every few seconds, so a burst of
+# reads within a consensus run shares one RPC call per feed
+_FEED_CACHE = TTLCache(maxsize=256, ttl=2)
+# TTLCache isn't thread-safe, and each Flask request thread runs its own event loop
+_FEED_CACHE_GUARD = threading.Lock()
+# Per-feed asyncio locks for each event loop, since asyncio locks belong to one loop.
+# A feed's lock is dropped once no fetch is holding or waiting on it
+_FEED_LOCKS = weakref.WeakKeyDictionary()
+
+
+def _cached_feed(key):
+    """Return the cached feed for a (network, feed_id) key, or None."""
+    with _FEED_CACHE_GUARD:
+        return _FEED_CACHE.get(key)
+
+
+def _cache_feed(key, feed):
+    """Cache a feed under its (network, feed_id) key and return it."""
+    with _FEED_CACHE_GUARD:
+        _FEED_CACHE[key] = feed
+    return feed
+
+
+def _feed_locks(keys):
+    """
+    Return the running loop's locks for the given feed keys, in a fixed order so that
+    fetches acquiring several of them can't deadlock. A miss waits only for an in-flight
+    fetch of the same feed.
+    """
+    loop = asyncio.get_running_loop()
+    locks = _FEED_LOCKS.get(loop)
+    if locks is None:
+        locks = _FEED_LOCKS[loop] = weakref.WeakValueDictionary()
+    ordered = []
+    for key in sorted(set(keys), key=repr):
+        lock = locks.get(key)
+        if lock is None:
+            lock = locks[key] = asyncio.Lock()
+        ordered.append(lock)
+    return ordered
+
 
 class FTSODataFetcher:
+    """
+    Fetches FTSO feeds and external data. Use it as an async context manager, or call
+    close(), to release its RPC and external HTTP sessions.
+    """
+    
     def __init__(self, network="coston2"):
         """Initialize the FTSO data fetcher with network configuration."""
         self.network = network
         self.ftso_endpoint = self._get_network_endpoint(network)
         self.ftso_address = self._get_ftso_address(network)
         
-        # Initialize Web3 (non-async for simpler implementation)
-        self.w3 = Web3(HTTPProvider(self.ftso_endpoint))
+        # Async Web3, so contract calls are awaited directly rather than run on a thread pool
+        self.w3 = AsyncWeb3(AsyncHTTPProvider(self.ftso_endpoint))
         
         # Load ABI
         self.abi = self._load_ftso_abi()
-        self.ftso_contract = self.w3.eth.contract(address=self.w3.to_checksum_address(self.ftso_address), abi=self.abi)
+        self.ftso_contract = self.w3.eth.contract(address=AsyncWeb3.to_checksum_address(self.ftso_address), abi=self.abi)
+        
+        # Created on first use and kept so external requests reuse connections
+        self._session = None
+        
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def close(self):
+        """Close the RPC connection and the HTTP session if one was opened."""
+        await self.w3.provider.disconnect()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def _get_session(self):
+        """Return the fetcher's HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=64))
+        return self._session
         
     def _get_network_endpoint(self, network):
         """Get the RPC endpoint for the specified network."""
@@ -67,42 +140,61 @@ class FTSODataFetcher:
     
     async def fetch_price_feed(self, feed_id, time_range=None):
         """Fetch specific price feed data from FTSO."""
-        # For async compatibility, we'll simulate this with asyncio
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, 
-            lambda: self.ftso_contract.functions.getFeedById(feed_id).call()
-        )
+        key = (self.network, feed_id)
+        feed = _cached_feed(key)
+        if feed is None:
+            [lock] = _feed_locks([key])
+            async with lock:
+                feed = _cached_feed(key)
+                if feed is None:
+                    result = await self.ftso_contract.functions.getFeedById(feed_id).call()
+                    feed = _cache_feed(key, {
+                        "value": result[0],
+                        "decimals": result[1],
+                        "timestamp": result[2],
+                        "feed_id": feed_id
+                    })
         
-        return {
-            "value": result[0],
-            "decimals": result[1],
-            "timestamp": result[2],
-            "feed_id": feed_id
-        }
+        # Copies, so callers can't alter the cached feeds
+        return dict(feed)
     
     async def fetch_multiple_feeds(self, feed_ids, time_range=None):
         """Fetch multiple feeds for cross-referencing."""
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: self.ftso_contract.functions.getFeedsById(feed_ids).call()
-        )
+        feeds_by_id = await self.fetch_price_feeds_bulk(feed_ids)
+        return [feeds_by_id[feed_id] for feed_id in feed_ids]
+    
+    async def fetch_price_feeds_bulk(self, feed_ids):
+        """Fetch several feeds in a single getFeedsById call, keyed by feed ID."""
+        feed_ids = list(feed_ids)
+        feeds = {feed_id: _cached_feed((self.network, feed_id)) for feed_id in feed_ids}
+        
+        missing = [feed_id for feed_id, feed in feeds.items() if feed is None]
+        if missing:
+            async with AsyncExitStack() as stack:
+                for lock in _feed_locks([(self.network, feed_id) for feed_id in missing]):
+                    await stack.enter_async_context(lock)
+                
+                # Only the feeds still missing once their locks are held are read from the chain
+                for feed_id in missing:
+                    feeds[feed_id] = _cached_feed((self.network, feed_id))
+                missing = [feed_id for feed_id in missing if feeds[feed_id] is None]
+                
+                if missing:
+                    result = await self.ftso_contract.functions.getFeedsById(missing).call()
+                    for i, feed_id in enumerate(missing):
+                        feeds[feed_id] = _cache_feed((self.network, feed_id), {
+                            "value": result[0][i],
+                            "decimals": result[1][i],
+                            "timestamp": result[2],
+                            "feed_id": feed_id
+                        })
         
-        feeds = []
-        for i, feed_id in enumerate(feed_ids):
-            feeds.append({
-                "value": result[0][i],
-                "decimals": result[1][i],
-                "timestamp": result[2],
-                "feed_id": feed_id
-            })
-        return feeds
+        # Copies, so callers can't alter the cached feeds
+        return {feed_id: dict(feed) for feed_id, feed in feeds.items()}
     
     async def fetch_external_data(self, api_endpoint, params=None):
         """Fetch additional data from external APIs for more comprehensive analysis."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(api_endpoint, params=params) as response:
-                if response.status != 200:
-                    return {"error": f"API request failed with status {response.status}"}
-                return await response.json() 
\ No newline at end of file
+        async with self._get_session().get(api_endpoint, params=params) as response:
+            if response.status != 200:
+                return {"error": f"API request failed with status {response.status}"}
+            return await response.json() 
\ No newline at end of file
@@ -4,6 +4,20 @@ from datetime import datetime
 from dateutil.parser import parse as parse_date
 import json
 
+# Patterns for extracting query components, compiled once at import
+_PRICE_RE = re.compile(r"(\$[0-9,]+(?:\.[0-9]+)?|[0-9,]+(?:\.[0-9]+)?\s*(?:USD|dollars))")
+_DATE_RE = re.compile(r"((?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}|Q[1-4]\s+\d{4}|EOY\s+\d{4}|\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2})")
+_PAIR_RE = re.compile(r"([A-Z]{3,4})/([A-Z]{3,4})")
+_PCT_RE = re.compile(r"(\d+(?:\.\d+)?%)")
+_TIMEFRAME_RE = re.compile(r"(by\s+end\s+of\s+\d{4}|within\s+\d+\s+(?:days|weeks|months|years)|before\s+\d{4})", re.IGNORECASE)
+
+# Question-type keywords, matched against the lowercased question
+_QTYPE_PRICE_RE = re.compile(r"price|worth|value|cost|rate")
+_QTYPE_USD_RE = re.compile(r"\$|usd|dollar")
+_QTYPE_EVENT_RE = re.compile(r"will|happen|occur|launch|release|announce")
+_QTYPE_COMP_RE = re.compile(r"higher than|lower than|more than|less than|exceed|fall below|outperform")
+_QTYPE_TEMPORAL_RE = re.compile(r"when|by what date|how soon|how long")
+
 class QueryProcessor:
     """Processes prediction market questions into standardized formats for AI analysis."""
     
@@ -18,7 +32,17 @@ class QueryProcessor:
             "USDT": "Tether"
         }
         
-        self.feed_id_mapping = {
+        # One alternation over every ticker and full name, scanned in a single pass.
+        # The lookahead matches at every position, so overlapping mentions are all found
+        self._asset_by_term = {}
+        for asset, full_name in self.common_assets.items():
+            self._asset_by_term[asset] = asset
+            self._asset_by_term[full_name] = asset
+        terms = sorted(self._asset_by_term, key=len, reverse=True)
+        self._asset_re = re.compile("(?=(" + "|".join(map(re.escape, terms)) + "))")
+        
+        # Feed IDs as hex strings, for display and JSON
+        self.feed_id_mapping_hex = {
             "BTC/USD": "0x014254432f55534400000000000000000000000000",
             "ETH/USD": "0x014554482f55534400000000000000000000000000",
             "FLR/USD": "0x01464c522f55534400000000000000000000000000",
@@ -27,6 +51,10 @@ class QueryProcessor:
             "USDC/USD": "0x015553444300000000000000000000000000000000",
             "USDT/USD": "0x0155534454000000000000000000000000000000"
         }
+        # Decoded once, so contract calls get the raw bytes without per-call hex parsing
+        self.feed_id_mapping = {
+            feed: bytes.fromhex(feed_id[2:]) for feed, feed_id in self.feed_id_mapping_hex.items()
+        }
     
     def process_query(self, question):
         """
@@ -34,30 +62,23 @@ class QueryProcessor:
         and identify required data feeds.
         """
         # Extract potential price thresholds
-        price_pattern = r"(\$[0-9,]+(?:\.[0-9]+)?|[0-9,]+(?:\.[0-9]+)?\s*(?:USD|dollars))"
-        price_matches = re.findall(price_pattern, question)
+        price_matches = _PRICE_RE.findall(question)
         
         # Extract potential date references
-        date_pattern = r"((?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}|Q[1-4]\s+\d{4}|EOY\s+\d{4}|\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2})"
-        date_matches = re.findall(date_pattern, question)
+        date_matches = _DATE_RE.findall(question)
         
         # Identify crypto assets mentioned
-        asset_matches = []
-        for asset, full_name in self.common_assets.items():
-            if asset in question or full_name in question:
-                asset_matches.append(asset)
+        found = {self._asset_by_term[term] for term in self._asset_re.findall(question)}
+        asset_matches = [asset for asset in self.common_assets if asset in found]
         
         # Identify price pairs
-        pair_pattern = r"([A-Z]{3,4})/([A-Z]{3,4})"
-        pair_matches = re.findall(pair_pattern, question)
+        pair_matches = _PAIR_RE.findall(question)
         
         # Check for percentage terms
-        percentage_pattern = r"(\d+(?:\.\d+)?%)"
-        percentage_matches = re.findall(percentage_pattern, question)
+        percentage_matches = _PCT_RE.findall(question)
         
         # Check for specific timeframes
-        timeframe_pattern = r"(by\s+end\s+of\s+\d{4}|within\s+\d+\s+(?:days|weeks|months|years)|before\s+\d{4})"
-        timeframe_matches = re.findall(timeframe_pattern, question, re.IGNORECASE)
+        timeframe_matches = _TIMEFRAME_RE.findall(question)
         
         # Determine feed IDs needed
         required_feeds = []
@@ -94,19 +115,19 @@ class QueryProcessor:
         question_lower = question.lower()
         
         # Price prediction questions
-        if re.search(r"price|worth|value|cost|rate", question_lower) and re.search(r"\$|usd|dollar", question_lower):
+        if _QTYPE_PRICE_RE.search(question_lower) and _QTYPE_USD_RE.search(question_lower):
             return "price_prediction"
         
         # Event occurrence questions
-        if re.search(r"will|happen|occur|launch|release|announce", question_lower):
+        if _QTYPE_EVENT_RE.search(question_lower):
             return "event_occurrence"
         
         # Comparative questions
-        if re.search(r"higher than|lower than|more than|less than|exceed|fall below|outperform", question_lower):
+        if _QTYPE_COMP_RE.search(question_lower):
             return "comparative"
         
         # Temporal questions
-        if re.search(r"when|by what date|how soon|how long", question_lower):
+        if _QTYPE_TEMPORAL_RE.search(question_lower):
             return "temporal"
         
         # Default to generic
@@ -1,62 +1,95 @@
 # verification.py
+import heapq
 import re
 from collections import Counter
+from operator import itemgetter
 from datetime import datetime
 
+# The citation styles, fused into one pattern so a response is scanned once. Each style
+# captures its text under its own group; the outer lookahead lets a match start at every
+# position, so styles still overlap exactly as they would if scanned separately
+_CITATION_GROUPS = ("src", "num", "cit", "ref")
+_CITATION_RE = re.compile(
+    r"(?="
+    r"Source:\s*(?P<src>.*?)(?=Source:|$)"
+    r"|\[\d+\]\s*(?P<num>.*?)(?=\[\d+\]|$)"
+    r"|Citation\s*\d+:\s*(?P<cit>.*?)(?=Citation\s*\d+:|$)"
+    r"|Reference\s*\d+:\s*(?P<ref>.*?)(?=Reference\s*\d+:|$)"
+    r")",
+    re.DOTALL
+)
+# Literals every citation match starts with. Text without any of them can't match, so the
+# far cheaper substring checks let it skip the pattern scan
+_CITATION_MARKERS = ("Source:", "[", "Citation", "Reference")
+_URL_RE = re.compile(r'https?://[^\s)>]+')
+
+# Confidence and decision phrasing, matched against lowercased text
+_CONFIDENCE_RE = re.compile(r"confidence\s*(?:level|score)?(?:\s*:)?\s*(\d+(?:\.\d+)?)\s*(?:out of|\/)?\s*10")
+_YES_RE = re.compile(r"(?:answer|outcome|result|conclusion)(?:\s*:)?\s*(yes|true|correct|affirm)")
+_NO_RE = re.compile(r"(?:answer|outcome|result|conclusion)(?:\s*:)?\s*(no|false|incorrect|deny)")
+_YES_WORD_RE = re.compile(r"\byes\b")
+_NO_WORD_RE = re.compile(r"\bno\b")
+_TRUE_WORD_RE = re.compile(r"\btrue\b")
+_FALSE_WORD_RE = re.compile(r"\bfalse\b")
+
+# Numerical claims compared by check_factual_consistency
+_PRICE_RE = re.compile(r"\$\s*(\d+(?:,\d+)*(?:\.\d+)?)")
+_PCT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*%")
+_DATE_RE = re.compile(r"\b(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}\b")
+
+# Joins responses so each claim pattern scans them all at once. NUL is neither whitespace,
+# a digit nor a word character, so no claim can match across two responses
+_RESPONSE_SEPARATOR = "\x00"
+
 class VerificationModule:
     """Handles verification and citation tracking for prediction market decisions."""
     
-    def __init__(self):
-        self.common_citation_patterns = [
-            r"Source:\s*(.*?)(?=Source:|$)",
-            r"\[(\d+)\]\s*(.*?)(?=\[\d+\]|$)",
-            r"Citation\s*(\d+):\s*(.*?)(?=Citation\s*\d+:|$)",
-            r"Reference\s*(\d+):\s*(.*?)(?=Reference\s*\d+:|$)"
-        ]
-    
     def extract_citations(self, text):
         """Extract citations from model responses using various patterns."""
-        citations = []
+        # Grouped by style, in the order the styles are listed
+        by_style = {group: [] for group in _CITATION_GROUPS}
+        if any(marker in text for marker in _CITATION_MARKERS):
+            for match in _CITATION_RE.finditer(text):
+                by_style[match.lastgroup].append(match.group(match.lastgroup).strip())
         
-        for pattern in self.common_citation_patterns:
-            matches = re.findall(pattern, text, re.DOTALL)
-            if matches:
-                if isinstance(matches[0], tuple):
-                    citations.extend([m[1].strip() if len(m) > 1 else m[0].strip() for m in matches])
-                else:
-                    citations.extend([m.strip() for m in matches])
+        citations = [citation for group in _CITATION_GROUPS for citation in by_style[group]]
         
         # Also look for URL patterns
-        url_pattern = r'https?://[^\s)>]+'
-        urls = re.findall(url_pattern, text)
-        citations.extend(urls)
+        if "http" in text:
+            citations.extend(_URL_RE.findall(text))
         
         return citations
     
-    def aggregate_citations(self, responses):
-        """Collect and merge citations from multiple responses."""
-        all_citations = []
+    def aggregate_citations(self, responses, top_k=None):
+        """Collect and merge citations from multiple responses, keeping only the top_k most frequent if given."""
+        # Count frequency of each citation as each response is scanned
+        citation_counter = Counter()
         
+        # Identical responses are only scanned once
+        citations_by_response = {}
         for response in responses:
-            citations = self.extract_citations(response)
-            all_citations.extend(citations)
-        
-        # Count frequency of each citation
-        citation_counter = Counter(all_citations)
+            citations = citations_by_response.get(response)
+            if citations is None:
+                citations = citations_by_response[response] = self.extract_citations(response)
+            citation_counter.update(citations)
         
         # Sort by frequency, then alphabetically
-        sorted_citations = sorted(citation_counter.items(), key=lambda x: (-x[1], x[0]))
+        if top_k is not None:
+            sorted_citations = heapq.nsmallest(top_k, citation_counter.items(), key=lambda x: (-x[1], x[0]))
+        else:
+            # Two stable sorts on C key functions, instead of building a tuple key per citation
+            sorted_citations = sorted(citation_counter.items(), key=itemgetter(0))
+            sorted_citations.sort(key=itemgetter(1), reverse=True)
         
         return [citation for citation, count in sorted_citations]
     
     def extract_confidence(self, text):
         """Extract confidence scores from response text."""
-        confidence_pattern = r"confidence\s*(?:level|score)?(?:\s*:)?\s*(\d+(?:\.\d+)?)\s*(?:out of|\/)?\s*10"
-        matches = re.findall(confidence_pattern, text.lower())
+        match = _CONFIDENCE_RE.search(text.lower())
         
-        if matches:
+        if match:
             try:
-                return float(matches[0])
+                return float(match.group(1))
             except ValueError:
                 pass
         
@@ -64,26 +97,22 @@ class VerificationModule:
     
     def extract_decision(self, text):
         """Extract Yes/No or True/False decisions from response text."""
-        # Look for clear yes/no statements
-        yes_pattern = r"(?:answer|outcome|result|conclusion)(?:\s*:)?\s*(yes|true|correct|affirm)"
-        no_pattern = r"(?:answer|outcome|result|conclusion)(?:\s*:)?\s*(no|false|incorrect|deny)"
+        text = text.lower()
         
-        yes_match = re.search(yes_pattern, text.lower())
-        no_match = re.search(no_pattern, text.lower())
-        
-        if yes_match:
+        # Look for clear yes/no statements
+        if _YES_RE.search(text):
             return "YES"
-        elif no_match:
+        elif _NO_RE.search(text):
             return "NO"
         
         # Check for other indicators
-        if re.search(r"\byes\b", text.lower()):
+        if _YES_WORD_RE.search(text):
             return "YES"
-        elif re.search(r"\bno\b", text.lower()):
+        elif _NO_WORD_RE.search(text):
             return "NO"
-        elif re.search(r"\btrue\b", text.lower()):
+        elif _TRUE_WORD_RE.search(text):
             return "YES"
-        elif re.search(r"\bfalse\b", text.lower()):
+        elif _FALSE_WORD_RE.search(text):
             return "NO"
         
         return "UNDETERMINED"
@@ -92,11 +121,19 @@ class VerificationModule:
         """Generate a complete verification report with evidence."""
         all_citations = self.aggregate_citations(responses + [final_response])
         
-        final_decision = self.extract_decision(final_response)
+        # Extract each distinct response's decision once, for the final decision and the agreement
+        decisions_by_response = {}
+        for response in responses + [final_response]:
+            if response not in decisions_by_response:
+                decisions_by_response[response] = self.extract_decision(response)
+        
+        final_decision = decisions_by_response[final_response]
         final_confidence = self.extract_confidence(final_response)
         
         # Calculate model agreement
-        model_agreement = self._calculate_agreement(responses)
+        model_agreement = self._calculate_agreement(
+            responses, [decisions_by_response[r] for r in responses]
+        )
         
         # Prepare verification report
         report = {
@@ -110,9 +147,10 @@ class VerificationModule:
         
         return report
     
-    def _calculate_agreement(self, responses):
-        """Calculate the level of agreement between model responses."""
-        decisions = [self.extract_decision(r) for r in responses]
+    def _calculate_agreement(self, responses, decisions=None):
+        """Calculate the level of agreement between model responses, reusing already extracted decisions if given."""
+        if decisions is None:
+            decisions = [self.extract_decision(r) for r in responses]
         decision_counter = Counter(decisions)
         
         if "UNDETERMINED" in decision_counter:
@@ -136,19 +174,12 @@ class VerificationModule:
         
     def check_factual_consistency(self, responses):
         """Check for factual consistency across model responses."""
-        # Extract all numerical claims from responses
-        price_pattern = r"\$\s*(\d+(?:,\d+)*(?:\.\d+)?)"
-        percentage_pattern = r"(\d+(?:\.\d+)?)\s*%"
-        date_pattern = r"\b(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}\b"
-        
-        prices = []
-        percentages = []
-        dates = []
-        
-        for response in responses:
-            prices.extend([float(p.replace(',', '')) for p in re.findall(price_pattern, response)])
-            percentages.extend([float(p) for p in re.findall(percentage_pattern, response)])
-            dates.extend(re.findall(date_pattern, response))
+        # Extract all numerical claims from responses, one scan per pattern
+        joined = _RESPONSE_SEPARATOR.join(responses)
+        # Prices need a "$" and percentages a "%", so skip scans that can't match
+        prices = [float(p.replace(',', '')) for p in _PRICE_RE.findall(joined)] if "$" in joined else []
+        percentages = [float(p) for p in _PCT_RE.findall(joined)] if "%" in joined else []
+        dates = _DATE_RE.findall(joined)
         
         # Check for significant variance in numerical claims
         price_variance = self._calculate_variance(prices)
@@ -187,10 +218,12 @@ class VerificationModule:
         """Calculate normalized variance for a list of numerical values."""
         if not values or len(values) < 2:
             return 0.0
-            
+        
+        # A pure-Python pass: the lists are a handful of model responses, far too short
+        # for NumPy's per-call overhead to pay off
         mean = sum(values) / len(values)
         if mean == 0:
             return 0.0
-            
+        
         variance = sum((x - mean) ** 2 for x in values) / len(values)
         return (variance ** 0.5) / mean  # Normalized standard deviation (coefficient of variation) 
\ No newline at end of file
@@ -88,14 +88,26 @@ class AsyncBaseRouter:
     common logic for API interaction.
     """
 
-    def __init__(self, base_url: str, api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        timeout: httpx.Timeout | float = 30.0,
+    ) -> None:
         """
         :param base_url: The base URL for the API.
         :param api_key: Optional API key for authentication.
+        :param limits: Optional connection pool limits for the HTTP client.
+        :param http2: Whether to negotiate HTTP/2 (requires the h2 package).
+        :param timeout: Request timeout for the HTTP client.
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(
+            timeout=timeout, limits=limits or httpx.Limits(), http2=http2
+        )
         self.headers = {"accept": "application/json"}
         if self.api_key:
             self.headers["Authorization"] = f"Bearer {self.api_key}"
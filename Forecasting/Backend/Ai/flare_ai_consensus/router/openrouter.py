@@ -1,9 +1,14 @@
+import asyncio
+
+import httpx
+
 from flare_ai_consensus.router.base_router import (
     AsyncBaseRouter,
     BaseRouter,
     ChatRequest,
     CompletionRequest,
 )
+from flare_ai_consensus.settings import settings
 
 
 class OpenRouterProvider(BaseRouter):
@@ -81,15 +86,36 @@ class AsyncOpenRouterProvider(AsyncBaseRouter):
     """Asynchronous provider to interact with the OpenRouter API."""
 
     def __init__(
-        self, api_key: str | None = None, base_url: str = "https://openrouter.ai/api/v1"
+        self,
+        api_key: str | None = None,
+        base_url: str = "https://openrouter.ai/api/v1",
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        timeout: httpx.Timeout | float = 30.0,
+        max_parallel_requests: int | None = None,
     ) -> None:
         """
         Initialize the AsyncOpenRouterProvider.
 
         :param api_key: Optional API key for authentication.
         :param base_url: Optional custom base URL.
-        """
-        super().__init__(base_url, api_key)
+        :param limits: Optional connection pool limits for the HTTP client.
+        :param http2: Whether to negotiate HTTP/2 (requires the h2 package).
+        :param timeout: Request timeout for the HTTP client.
+        :param max_parallel_requests: Most requests in flight at once, shared by
+            every caller of this provider. Defaults to limits.max_connections, or
+            to settings.open_router_max_parallel when limits does not set one.
+        """
+        if max_parallel_requests is None:
+            if limits is not None and limits.max_connections is not None:
+                max_parallel_requests = limits.max_connections
+            else:
+                max_parallel_requests = settings.open_router_max_parallel
+        super().__init__(
+            base_url, api_key, limits=limits, http2=http2, timeout=timeout
+        )
+        # Requests beyond the limit wait here rather than piling onto rate limits
+        self._semaphore = asyncio.Semaphore(max_parallel_requests)
 
     async def send_completion(self, payload: CompletionRequest) -> dict:
         """
@@ -99,7 +125,8 @@ class AsyncOpenRouterProvider(AsyncBaseRouter):
         :return: The JSON response from the API.
         """
         endpoint = "/completions"
-        return await self._post(endpoint, payload)
+        async with self._semaphore:
+            return await self._post(endpoint, payload)
 
     async def send_chat_completion(self, payload: ChatRequest) -> dict:
         """
@@ -109,4 +136,5 @@ class AsyncOpenRouterProvider(AsyncBaseRouter):
         :return: The JSON response from the API.
         """
         endpoint = "/chat/completions"
-        return await self._post(endpoint, payload)
+        async with self._semaphore:
+            return await self._post(endpoint, payload)
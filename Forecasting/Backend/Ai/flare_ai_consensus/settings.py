@@ -93,6 +93,8 @@ class Settings(BaseSettings):
     # OpenRouter Settings
     open_router_base_url: str = "https://openrouter.ai/api/v1"
     open_router_api_key: str = ""
+    # Most requests a provider keeps in flight unless its limits set max_connections
+    open_router_max_parallel: int = 16
 
     # Path Settings
     data_path: Path = create_path("data")
@@ -82,6 +82,12 @@ async def process_prediction_market_query(question, iterations=2):
         }
 
 
+async def fetch_feed(network, feed_id):
+    """Fetch one FTSO feed, closing the fetcher's connections before the event loop ends"""
+    async with FTSODataFetcher(network=network) as data_fetcher:
+        return await data_fetcher.fetch_price_feed(feed_id)
+
+
 # API endpoint for prediction market verification
 @app.route('/verify_prediction', methods=['POST'])
 def verify_prediction_api():
@@ -134,7 +140,7 @@ def query_data_feeds_api():
         
         # Get feed IDs mapping for reference
         query_processor = QueryProcessor()
-        feed_mapping = query_processor.feed_id_mapping
+        feed_mapping = query_processor.feed_id_mapping_hex
         
         # Return the available feeds
         return jsonify({
@@ -171,6 +177,9 @@ def process_query_api():
         query_processor = QueryProcessor()
         processed_query = query_processor.process_query(question)
         
+        # Feed IDs are raw bytes, so send them back in their hex form
+        processed_query["required_feeds"] = ["0x" + feed_id.hex() for feed_id in processed_query["required_feeds"]]
+        
         # Generate data requirements
         data_requirements = query_processor.generate_data_requirements(processed_query)
         
@@ -203,11 +212,8 @@ def fetch_feed_data_api():
                 "status": "failed"
             }), 400
         
-        # Initialize data fetcher
-        data_fetcher = FTSODataFetcher(network=network)
-        
         # Fetch real data asynchronously
-        result = asyncio.run(data_fetcher.fetch_price_feed(feed_id))
+        result = asyncio.run(fetch_feed(network, feed_id))
         
         # Process and enhance the data
         enhanced_data = enhance_feed_data(result, feed_id)